@@ -1,4 +1,10 @@
-from besser.BUML.metamodel.structural import DomainModel
+import asyncio
+import copy
+from datetime import datetime, timezone
+
+from besser.BUML.metamodel.structural import (DomainModel, Class, Parameter, Method, Property, BinaryAssociation,
+                                              AssociationClass, Enumeration, EnumerationLiteral, Generalization,
+                                              Constraint)
 from utils import (multiplicity_from_string, serialize_domain_model, deserialize_domain_model,
                                          download_model_from, upload_model_to, save_model, get_model)
 
@@ -34,22 +40,18 @@ def base_add_class(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Class  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding class '{name}' to domain model")
 
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
 
+        # Check if a types with the same name already exists
+        clashing_types = [t for t in domain_model.types if t.name == name]
+        if any(isinstance(t, Class) for t in clashing_types):
+            logger.warning(f"Class '{name}' already exists in model")
+            return f"Error adding class '{name}': A class with name '{name}' already exists in the model"
+
         # Default to empty sets if None provided
         attributes = attributes or set()
         methods = methods or set()
@@ -65,22 +67,14 @@ def base_add_class(
             timestamp=timestamp,  # type: ignore[arg-type]
             metadata=metadata,
             is_derived=is_derived,
-        )        # Check if a types with the same name already exists
-        existing_classes = domain_model.get_classes()
-        existing_class_names = {cls.name for cls in existing_classes}
-
-        if name in existing_class_names:
-            logger.warning(f"Class '{name}' already exists in model")
-            return f"Error adding class '{name}': A class with name '{name}' already exists in the model"
+        )
 
-        # Add the class directly to the types set to avoid BESSER's duplicate validation
-        # which seems to have issues with primitive types
-        try:
+        if not clashing_types:
             domain_model.add_type(new_class)  # type: ignore[attr-defined]
             logger.info(f"Successfully added class '{name}' to model")
-        except ValueError as ve:
-            logger.warning(f"add_type failed, using direct addition")
-            # If add_type fails due to duplicate primitive validation, add directly
+        else:
+            # BESSER's add_type rejects a name already used by a primitive type or an
+            # enumeration, add the class directly to the types set instead
             domain_model.types.add(new_class)  # type: ignore[attr-defined]
             logger.info(f"Successfully added class '{name}' to model using direct addition")
 
@@ -101,7 +95,7 @@ def base_add_method_to_class(
         class_name: str,
         visibility: str = "public",
         is_abstract: bool = False,
-        parameters: dict[str ,str] = dict(),
+        parameters: dict[str, str] | None = None,
         type_name :str = "str",
         code: str = "",
         timestamp = None,
@@ -116,7 +110,7 @@ def base_add_method_to_class(
         class_name (str): The name of the class that will contain the method.
         visibility (str): Determines the kind of visibility of the method (public as default).
         is_abstract (bool): Indicates if the method is abstract (False as default).
-        parameters (dict[str,str]): The mapping of parameters name and type for the method (dict() as default).
+        parameters (dict[str,str] | None): The mapping of parameters name and type for the method (default None).
         type_name (str): The name of the type of the method ("str" as default).
         code (str): code of the method ("" as default).
         timestamp (datetime | None): Object creation datetime (default is current time).
@@ -127,16 +121,6 @@ def base_add_method_to_class(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Parameter, Method  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding method '{name}' to class '{class_name}'")
 
@@ -145,15 +129,15 @@ def base_add_method_to_class(
 
 
         owner = domain_model.get_type_by_name(class_name)
-        existing_methods = owner.methods
-        existing_method_names = {method.name for method in existing_methods}
-
         method_type = domain_model.get_type_by_name(type_name)
 
-        if name in existing_method_names:
+        if any(method.name == name for method in owner.methods):
             logger.warning(f"Method '{name}' already exists in Class '{class_name}'")
             return f"Error adding method '{name}': A method with name '{name}' already exists in the class '{class_name}'"
 
+        # Default to an empty mapping if None provided
+        parameters = parameters or {}
+
         parameter_objects = set()
         for param_name, param_type_name in parameters.items():
             param_type = domain_model.get_type_by_name(type_name)
@@ -222,16 +206,6 @@ def base_add_attribute_to_class(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Multiplicity, Property  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding attribute '{name}' to class '{class_name}'")
 
@@ -239,12 +213,9 @@ def base_add_attribute_to_class(
             timestamp = datetime.now(timezone.utc)
 
         owner = domain_model.get_type_by_name(class_name)
-        existing_attributes = owner.attributes
-        existing_attribute_names = {attribute.name for attribute in existing_attributes}
-
         property_type = domain_model.get_type_by_name(type_name)
 
-        if name in existing_attribute_names:
+        if any(attribute.name == name for attribute in owner.attributes):
             logger.warning(f"Attribute '{name}' already exists in Class '{class_name}'")
             return f"Error adding attribute '{name}': An attribute with name '{name}' already exists in the class '{class_name}'"
 
@@ -317,16 +288,6 @@ def base_add_binary_association(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Property, BinaryAssociation  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding association '{name}' to model")
 
@@ -337,8 +298,7 @@ def base_add_binary_association(
         from_end_class = domain_model.get_type_by_name(from_class)
         to_end_class = domain_model.get_type_by_name(to_class)
 
-        existing_association_names = {x.name for x in domain_model.associations}
-        if name in existing_association_names:
+        if any(x.name == name for x in domain_model.associations):
             logger.warning(f"Association '{name}' already exists in the model")
             return f"Error adding association '{name}': An association with name '{name}' already exists in the model"
 
@@ -411,16 +371,6 @@ def base_add_association_class(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import AssociationClass  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding association class '{name}' to model")
 
@@ -472,16 +422,6 @@ def base_add_enumeration(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Enumeration, EnumerationLiteral  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding enumeration '{name}' to model")
 
@@ -529,16 +469,6 @@ def base_add_enumeration_literal(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import EnumerationLiteral  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding literal '{name}' to enumeration '{enumeration_name}'")
 
@@ -584,16 +514,6 @@ def base_add_generalization(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Generalization  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding generalization '{general_class_name}' <|-- '{specific_class_name}' to model")
 
@@ -640,16 +560,6 @@ def base_add_ocl_constraint(
         str: The updated domain model as base64 string, or an error message
              if a class with the same name already exists.
     """
-    from datetime import datetime
-    from datetime import timezone
-
-    try:
-        from besser.BUML.metamodel.structural import Constraint  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library must be installed (`pip install besser`)."
-        ) from exc
-
     try:
         logger.info(f"Adding constraint '{name}' to class {class_name}")
 
@@ -671,6 +581,85 @@ def base_add_ocl_constraint(
         return f"Error processing domain model: {str(e)}"
 
 
+_CREATIONS = {
+    "class": base_add_class,
+    "method": base_add_method_to_class,
+    "attribute": base_add_attribute_to_class,
+    "binary_association": base_add_binary_association,
+    "association_class": base_add_association_class,
+    "enumeration": base_add_enumeration,
+    "enumeration_literal": base_add_enumeration_literal,
+    "generalization": base_add_generalization,
+    "ocl_constraint": base_add_ocl_constraint,
+}
+
+
+def base_add_batch(
+        logger,
+        domain_model: DomainModel,
+        operations: list[dict],
+) -> DomainModel | str:
+    """Applies several additions to a B-UML DomainModel in a single pass.
+
+    Args:
+        domain_model (DomainModel): The B-UML domain model.
+        operations (list[dict]): The additions to apply, in order. Each one has a "kind" key
+            (class, method, attribute, binary_association, association_class, enumeration,
+            enumeration_literal, generalization or ocl_constraint) and the arguments of the
+            matching single creation tool, e.g. {"kind": "attribute", "name": "a", "class_name": "A", "type_name": "int"}.
+
+    Returns:
+        DomainModel | str: The updated domain model, or the error message of the first failing addition.
+            On error, `domain_model` may already hold the additions that came before the failing one.
+    """
+    logger.info(f"Applying {len(operations)} additions to domain model")
+
+    for index, operation in enumerate(operations):
+        try:
+            arguments = dict(operation)
+            kind = arguments.pop("kind", None)
+            base_add = _CREATIONS.get(kind)
+            if base_add is None:
+                return f"Error in addition #{index}: Unknown kind '{kind}', expected one of {', '.join(_CREATIONS)}"
+
+            domain_model = base_add(logger, domain_model, **arguments)
+        except Exception as e:
+            return f"Error in addition #{index}: {str(e)}"
+
+        if isinstance(domain_model, str):
+            return f"Error in addition #{index} ({kind}): {domain_model}"
+
+    # Return the updated model
+    return domain_model
+
+
+def _new_model_with_url(domain_model_url: str, name: str) -> str:
+    """Create a new empty model named `name` and upload it to `domain_model_url`."""
+    # Create a new DomainModel instance as base64
+    domain_model = DomainModel(name=name)
+    serialized_model = serialize_domain_model(domain_model)
+    # Upload the model
+    upload_model_to(serialized_model, domain_model_url)
+    return "Success"
+
+
+def _add_with_url(logger, base_add, domain_model_url: str, *args) -> str:
+    """Run `base_add` on the model stored at `domain_model_url` and upload the result."""
+    # Get the model
+    domain_model_base64 = download_model_from(domain_model_url)
+    # Deserialize the domain model
+    domain_model = deserialize_domain_model(domain_model_base64)
+
+    domain_model = base_add(logger, domain_model, *args)
+    if isinstance(domain_model, str):
+        return domain_model
+
+    serialized_model = serialize_domain_model(domain_model)
+    # Upload the model
+    upload_model_to(serialized_model, domain_model_url)
+    return "Success"
+
+
 def register_base64_creation_tools(mcp, logger):
 
     @mcp.tool()
@@ -683,13 +672,6 @@ def register_base64_creation_tools(mcp, logger):
         Returns:
             str: A new domain model instance as base64 string.
         """
-        try:
-            from besser.BUML.metamodel.structural import DomainModel  # type: ignore
-        except ImportError as exc:
-            raise RuntimeError(
-                "BESSER library must be installed (`pip install besser`)."
-            ) from exc
-
         # Create and return a new DomainModel instance as base64
         domain_model = DomainModel(name=name)
         return serialize_domain_model(domain_model)
@@ -744,7 +726,7 @@ def register_base64_creation_tools(mcp, logger):
             class_name: str,
             visibility: str = "public",
             is_abstract: bool = False,
-            parameters: dict[str ,str] = dict(),
+            parameters: dict[str, str] | None = None,
             type_name :str = "str",
             code: str = "",
             timestamp = None,
@@ -759,7 +741,7 @@ def register_base64_creation_tools(mcp, logger):
             class_name (str): The name of the class that will contain the method.
             visibility (str): Determines the kind of visibility of the method (public as default).
             is_abstract (bool): Indicates if the method is abstract (False as default).
-            parameters (dict[str,str]): The mapping of parameters name and type for the method (dict() as default).
+            parameters (dict[str,str] | None): The mapping of parameters name and type for the method (default None).
             type_name (str): The name of the type of the method ("str" as default).
             code (str): code of the method ("" as default).
             timestamp (datetime | None): Object creation datetime (default is current time).
@@ -1046,10 +1028,38 @@ def register_base64_creation_tools(mcp, logger):
         return serialize_domain_model(domain_model)
 
 
+    @mcp.tool()
+    def add_batch_base64(
+            domain_model_base64: str,
+            operations: list[dict],
+    ) -> str:
+        """Applies several additions to a B-UML DomainModel at once and returns the updated model as base64.
+
+        Args:
+            domain_model_base64 (str): The B-UML domain model as base64 string.
+            operations (list[dict]): The additions to apply, in order. Each one has a "kind" key
+                (class, method, attribute, binary_association, association_class, enumeration,
+                enumeration_literal, generalization or ocl_constraint) and the arguments of the
+                matching single creation tool, e.g. {"kind": "attribute", "name": "a", "class_name": "A", "type_name": "int"}.
+
+        Returns:
+            str: The updated domain model as base64 string, or the error message of the first failing addition.
+        """
+        # Deserialize the domain model
+        domain_model = deserialize_domain_model(domain_model_base64)
+
+        domain_model = base_add_batch(logger, domain_model, operations)
+        if isinstance(domain_model, str):
+            return domain_model
+
+        # Return the updated model as base64
+        return serialize_domain_model(domain_model)
+
+
 def register_url_creation_tools(mcp, logger):
 
     @mcp.tool()
-    def new_model_with_url(domain_model_url: str, name: str) -> str:
+    async def new_model_with_url(domain_model_url: str, name: str) -> str:
         """Creates a new B-UML DomainModel with the specified name.
 
         Args:
@@ -1059,23 +1069,11 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message.
         """
-        try:
-            from besser.BUML.metamodel.structural import DomainModel  # type: ignore
-        except ImportError as exc:
-            raise RuntimeError(
-                "BESSER library must be installed (`pip install besser`)."
-            ) from exc
-
-        # Create and return a new DomainModel instance as base64
-        domain_model = DomainModel(name=name)
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_new_model_with_url, domain_model_url, name)
 
 
     @mcp.tool()
-    def add_class_with_url(
+    async def add_class_with_url(
             domain_model_url: str,
             name: str,
             attributes=None,
@@ -1104,29 +1102,17 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_class(logger, domain_model, name, attributes, methods, is_abstract, is_read_only, behaviors, timestamp, metadata, is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_class, domain_model_url, name, attributes, methods, is_abstract, is_read_only, behaviors, timestamp, metadata, is_derived)
 
 
     @mcp.tool()
-    def add_method_to_class_with_url(
+    async def add_method_to_class_with_url(
             domain_model_url: str,
             name: str,
             class_name: str,
             visibility: str = "public",
             is_abstract: bool = False,
-            parameters: dict[str ,str] = dict(),
+            parameters: dict[str, str] | None = None,
             type_name :str = "str",
             code: str = "",
             timestamp = None,
@@ -1141,7 +1127,7 @@ def register_url_creation_tools(mcp, logger):
             class_name (str): The name of the class that will contain the method.
             visibility (str): Determines the kind of visibility of the method (public as default).
             is_abstract (bool): Indicates if the method is abstract (False as default).
-            parameters (dict[str,str]): The mapping of parameters name and type for the method (dict() as default).
+            parameters (dict[str,str] | None): The mapping of parameters name and type for the method (default None).
             type_name (str): The name of the type of the method ("str" as default).
             code (str): code of the method ("" as default).
             timestamp (datetime | None): Object creation datetime (default is current time).
@@ -1151,23 +1137,11 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_method_to_class(logger, domain_model, name, class_name, visibility, is_abstract, parameters, type_name, code, timestamp, metadata, is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_method_to_class, domain_model_url, name, class_name, visibility, is_abstract, parameters, type_name, code, timestamp, metadata, is_derived)
 
 
     @mcp.tool()
-    def add_attribute_to_class_with_url(
+    async def add_attribute_to_class_with_url(
             domain_model_url: str,
             name: str,
             class_name: str,
@@ -1202,25 +1176,13 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_attribute_to_class(logger, domain_model, name, class_name, type_name, multiplicity_str, visibility, is_composite, is_navigable, is_id, is_read_only, timestamp, metadata, is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_attribute_to_class, domain_model_url, name, class_name, type_name, multiplicity_str, visibility, is_composite, is_navigable, is_id, is_read_only, timestamp, metadata, is_derived)
 
 
 
 
     @mcp.tool()
-    def add_binary_association_with_url(
+    async def add_binary_association_with_url(
             domain_model_url: str,
             name: str,
             from_class: str,
@@ -1255,24 +1217,12 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_binary_association(logger, domain_model, name, from_class, to_class, role_from, role_to, multiplicity_from, multiplicity_to, is_bidirectional, is_composition, timestamp, metadata, is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_binary_association, domain_model_url, name, from_class, to_class, role_from, role_to, multiplicity_from, multiplicity_to, is_bidirectional, is_composition, timestamp, metadata, is_derived)
 
 
 
     @mcp.tool()
-    def add_association_class_with_url(
+    async def add_association_class_with_url(
             domain_model_url: str,
             name: str,
             association_name: str,
@@ -1293,24 +1243,12 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_association_class(logger, domain_model, name, association_name, timestamp, metadata, is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_association_class, domain_model_url, name, association_name, timestamp, metadata, is_derived)
 
 
 
     @mcp.tool()
-    def add_enumeration_with_url(
+    async def add_enumeration_with_url(
             domain_model_url: str,
             name: str,
             literals: set[str],
@@ -1329,24 +1267,12 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_enumeration(logger, domain_model, name, literals, timestamp, metadata)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_enumeration, domain_model_url, name, literals, timestamp, metadata)
 
 
 
     @mcp.tool()
-    def add_enumeration_literal_with_url(
+    async def add_enumeration_literal_with_url(
             domain_model_url: str,
             name: str,
             enumeration_name: str,
@@ -1365,24 +1291,12 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_enumeration_literal(logger, domain_model, name, enumeration_name, timestamp, metadata)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_enumeration_literal, domain_model_url, name, enumeration_name, timestamp, metadata)
 
 
 
     @mcp.tool()
-    def add_generalization_with_url(
+    async def add_generalization_with_url(
             domain_model_url: str,
             general_class_name: str,
             specific_class_name: str,
@@ -1401,24 +1315,12 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_add_generalization(logger, domain_model, general_class_name, specific_class_name, timestamp, is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
-
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_add_with_url, logger, base_add_generalization, domain_model_url, general_class_name, specific_class_name, timestamp, is_derived)
 
 
 
     @mcp.tool()
-    def add_ocl_constraint_with_url(
+    async def add_ocl_constraint_with_url(
             domain_model_url: str,
             name: str,
             class_name: str,
@@ -1439,20 +1341,27 @@ def register_url_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model from url
-        domain_model_base64 = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
+        return await asyncio.to_thread(_add_with_url, logger, base_add_ocl_constraint, domain_model_url, name, class_name, expression, timestamp, is_derived)
 
-        domain_model = base_add_ocl_constraint(logger, domain_model, name, class_name, expression, timestamp,
-                                               is_derived)
-        if isinstance(domain_model, str):
-            return domain_model
 
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+    @mcp.tool()
+    async def add_batch_with_url(
+            domain_model_url: str,
+            operations: list[dict],
+    ) -> str:
+        """Applies several additions to a B-UML DomainModel at once.
+
+        Args:
+            domain_model_url (str): The B-UML domain model URL location.
+            operations (list[dict]): The additions to apply, in order. Each one has a "kind" key
+                (class, method, attribute, binary_association, association_class, enumeration,
+                enumeration_literal, generalization or ocl_constraint) and the arguments of the
+                matching single creation tool, e.g. {"kind": "attribute", "name": "a", "class_name": "A", "type_name": "int"}.
+
+        Returns:
+            str: 'Success' or the error message of the first failing addition
+        """
+        return await asyncio.to_thread(_add_with_url, logger, base_add_batch, domain_model_url, operations)
 
 
 
@@ -1468,13 +1377,6 @@ def register_creation_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message.
         """
-        try:
-            from besser.BUML.metamodel.structural import DomainModel  # type: ignore
-        except ImportError as exc:
-            raise RuntimeError(
-                "BESSER library must be installed (`pip install besser`)."
-            ) from exc
-
         # Create and return a new DomainModel instance as base64
         domain_model = DomainModel(name=name)
         # Save the model
@@ -1526,7 +1428,7 @@ def register_creation_tools(mcp, logger):
             class_name: str,
             visibility: str = "public",
             is_abstract: bool = False,
-            parameters: dict[str ,str] = dict(),
+            parameters: dict[str, str] | None = None,
             type_name :str = "str",
             code: str = "",
             timestamp = None,
@@ -1540,7 +1442,7 @@ def register_creation_tools(mcp, logger):
             class_name (str): The name of the class that will contain the method.
             visibility (str): Determines the kind of visibility of the method (public as default).
             is_abstract (bool): Indicates if the method is abstract (False as default).
-            parameters (dict[str,str]): The mapping of parameters name and type for the method (dict() as default).
+            parameters (dict[str,str] | None): The mapping of parameters name and type for the method (default None).
             type_name (str): The name of the type of the method ("str" as default).
             code (str): code of the method ("" as default).
             timestamp (datetime | None): Object creation datetime (default is current time).
@@ -1795,5 +1697,31 @@ def register_creation_tools(mcp, logger):
         if isinstance(domain_model, str):
             return domain_model
 
+        save_model(domain_model)
+        return "Success"
+
+
+    @mcp.tool()
+    def add_batch(
+            operations: list[dict],
+    ) -> str:
+        """Applies several additions to a B-UML DomainModel at once.
+
+        Args:
+            operations (list[dict]): The additions to apply, in order. Each one has a "kind" key
+                (class, method, attribute, binary_association, association_class, enumeration,
+                enumeration_literal, generalization or ocl_constraint) and the arguments of the
+                matching single creation tool, e.g. {"kind": "attribute", "name": "a", "class_name": "A", "type_name": "int"}.
+
+        Returns:
+            str: 'Success' or the error message of the first failing addition
+        """
+        # Work on a copy so that a failure half way through leaves the shared model untouched
+        domain_model = copy.deepcopy(get_model())
+
+        domain_model = base_add_batch(logger, domain_model, operations)
+        if isinstance(domain_model, str):
+            return domain_model
+
         save_model(domain_model)
         return "Success"
\ No newline at end of file
@@ -1,8 +1,81 @@
+import asyncio
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
 from besser.BUML.metamodel.structural import DomainModel
 from utils import serialize_domain_model, deserialize_domain_model, \
     download_model_from, upload_model_to, save_model, get_model
 
 
+def _mark_dirty(domain_model: DomainModel):
+    """Flag the domain model as actually modified by a deletion."""
+    domain_model._dirty = True
+
+
+def _pop_dirty(domain_model: DomainModel) -> bool:
+    """Return whether the domain model was modified and clear the flag before it gets serialized."""
+    return vars(domain_model).pop('_dirty', False)
+
+
+# Error messages of deletions that failed on a given serialized model, keyed by
+# ((payload length, deletion, arguments), payload digest). A deletion is a pure function
+# of the model and its arguments, so a repeated failing call is answered without
+# deserializing. The payload is only hashed when a failure of the same shape is known,
+# which keeps the lookup off the successful calls. Shared by the tool threads, hence the lock.
+_KNOWN_FAILURES_SIZE = 256
+_known_failures: OrderedDict = OrderedDict()
+_failure_shapes: dict[tuple, int] = {}
+_known_failures_lock = threading.Lock()
+
+
+def _failure_shape(serialized_model: str, base_delete, args) -> tuple:
+    """Return the cheap part of the key of a deletion call on a serialized model."""
+    return len(serialized_model), base_delete.__name__, repr(args)
+
+
+def _payload_digest(serialized_model: str) -> bytes:
+    """Return the digest identifying a serialized model."""
+    return hashlib.blake2b(serialized_model.encode('ascii'), digest_size=16).digest()
+
+
+def _known_failure(serialized_model: str, base_delete, args) -> str | None:
+    """Return the error message of a previous identical failed deletion call, or None."""
+    shape = _failure_shape(serialized_model, base_delete, args)
+    with _known_failures_lock:
+        if shape not in _failure_shapes:
+            return None
+    key = (shape, _payload_digest(serialized_model))
+    with _known_failures_lock:
+        message = _known_failures.get(key)
+        if message is not None:
+            _known_failures.move_to_end(key)
+        return message
+
+
+def _remember_failure(serialized_model: str, base_delete, args, message: str):
+    """Record the error message of a failed deletion call, evicting the oldest entry when full."""
+    shape = _failure_shape(serialized_model, base_delete, args)
+    key = (shape, _payload_digest(serialized_model))
+    with _known_failures_lock:
+        if key in _known_failures:
+            _known_failures.move_to_end(key)
+            return
+        _known_failures[key] = message
+        _failure_shapes[shape] = _failure_shapes.get(shape, 0) + 1
+        if len(_known_failures) > _KNOWN_FAILURES_SIZE:
+            (old_shape, _), _ = _known_failures.popitem(last=False)
+            _failure_shapes[old_shape] -= 1
+            if not _failure_shapes[old_shape]:
+                del _failure_shapes[old_shape]
+
+
+def _find_by_name(elements, name: str):
+    """Return the first element of `elements` named `name`, or None."""
+    return next((element for element in elements if element.name == name), None)
+
+
 def base_delete_class(
         logger,
         domain_model: DomainModel,
@@ -28,6 +101,7 @@ def base_delete_class(
             return f"Error removing class '{name}': No class with name '{name}' exists in the model"
         else:
             domain_model.type.remove(to_remove)
+            _mark_dirty(domain_model)
 
         # Return the updated model
         return domain_model
@@ -60,17 +134,14 @@ def base_delete_method_from_class(
         logger.info(f"Removing method '{name}' from class '{class_name}'")
 
         the_class = domain_model.get_type_by_name(class_name)
-        the_method = None
-        for method in the_class.methods:
-            if method.name == name:
-                the_method = method
-                break
+        the_method = _find_by_name(the_class.methods, name)
 
         if the_method is None:
             logger.warning(f"Method '{name}' do not exists in '{class_name}'")
             return f"Error removing method '{name}': No method with name '{name}' exists in '{class_name}'"
         else:
             the_class.methods.remove(the_method)
+            _mark_dirty(domain_model)
         logger.info(f"Successfully removed method '{name}' from class '{class_name}'")
 
         # Return the updated model
@@ -104,17 +175,14 @@ def base_delete_attribute_from_class(
         logger.info(f"Removing attribute '{name}' from class '{class_name}'")
 
         the_class = domain_model.get_type_by_name(class_name)
-        the_attribute = None
-        for attribute in the_class.attributes:
-            if attribute.name == name:
-                the_attribute = attribute
-                break
+        the_attribute = _find_by_name(the_class.attributes, name)
 
         if the_attribute is None:
             logger.warning(f"Attribute '{name}' do not exists in '{class_name}'")
             return f"Error removing attribute '{name}': No attribute with name '{name}' exists in '{class_name}'"
         else:
             the_class.attributes.remove(the_attribute)
+            _mark_dirty(domain_model)
         logger.info(f"Successfully removed attribute '{name}' from class '{class_name}'")
 
         # Return the updated model
@@ -147,16 +215,14 @@ def base_delete_binary_association(
     try:
         logger.info(f"Removing association '{name}' from model")
 
-        the_association = None
-        for association in domain_model.associations:
-            if association.name == name:
-                the_association = association
+        the_association = _find_by_name(domain_model.associations, name)
 
         if the_association is None:
             logger.warning(f"Association '{name}' do not exists in model")
             return f"Error removing association '{name}': No association with name '{name}' exists in model"
         else:
             domain_model.associations.remove(the_association)
+            _mark_dirty(domain_model)
 
         logger.info(f"Successfully removed association '{name}' from model")
 
@@ -195,6 +261,7 @@ def base_delete_association_class(
             return f"Error removing association class '{name}': No association class with name '{name}' exists in the model"
         else:
             domain_model.type.remove(to_remove)
+            _mark_dirty(domain_model)
 
         # Return the updated model
         return domain_model
@@ -232,6 +299,7 @@ def base_delete_enumeration(
             return f"Error removing enumeration '{name}': No enumeration with name '{name}' exists in the model"
         else:
             domain_model.type.remove(to_remove)
+            _mark_dirty(domain_model)
 
         # Return the updated model
         return domain_model
@@ -265,17 +333,14 @@ def base_delete_enumeration_literal(
         logger.info(f"Removing literal '{name}' from enumeration '{enumeration_name}'")
 
         the_enumeration = domain_model.get_type_by_name(enumeration_name)
-        the_literal = None
-        for literal in the_enumeration.literals:
-            if literal.name == name:
-                the_literal = literal
-                break
+        the_literal = _find_by_name(the_enumeration.literals, name)
 
         if the_literal is None:
             logger.warning(f"Literal '{name}' do not exists in '{enumeration_name}'")
             return f"Error removing literal '{name}': No literal with name '{name}' exists in '{enumeration_name}'"
         else:
             the_enumeration.literals.remove(the_literal)
+            _mark_dirty(domain_model)
         logger.info(f"Successfully removed literal '{name}' from enumeration '{enumeration_name}'")
 
         # Return the updated model
@@ -312,10 +377,8 @@ def base_delete_generalization(
         general_class = domain_model.get_type_by_name(general_class_name)
         specific_class = domain_model.get_type_by_name(specific_class_name)
 
-        the_generalization = None
-        for generalization in domain_model.generalizations:
-            if generalization.general == general_class and generalization.specific == specific_class:
-                the_generalization = generalization
+        the_generalization = next((generalization for generalization in domain_model.generalizations
+                                   if generalization.general == general_class and generalization.specific == specific_class), None)
 
         if the_generalization is None:
             logger.warning(f"Generalization '{general_class_name}' <|-- '{specific_class_name}' do not exists in model")
@@ -324,6 +387,7 @@ def base_delete_generalization(
             general_class.generalizations.remove(the_generalization)
             specific_class.generalizations.remove(the_generalization)
             domain_model.generalizations.remove(the_generalization)
+            _mark_dirty(domain_model)
 
         logger.info(f"Successfully removed generalization '{general_class_name}' <|-- '{specific_class_name}' from model")
 
@@ -354,8 +418,10 @@ def base_delete_ocl_constraint(
     try:
         logger.info(f"Removing constraint '{name}' from domain model")
 
-        updated_constraints = {constraint for constraint in domain_model.constraints if constraint.name is not name}
-        domain_model.constraints = updated_constraints
+        updated_constraints = {constraint for constraint in domain_model.constraints if constraint.name != name}
+        if len(updated_constraints) != len(domain_model.constraints):
+            domain_model.constraints = updated_constraints
+            _mark_dirty(domain_model)
 
         # Return the updated model
         return domain_model
@@ -367,8 +433,129 @@ def base_delete_ocl_constraint(
         return f"Error processing domain model: {str(e)}"
 
 
+_DELETIONS = {
+    "class": base_delete_class,
+    "method": base_delete_method_from_class,
+    "attribute": base_delete_attribute_from_class,
+    "binary_association": base_delete_binary_association,
+    "association_class": base_delete_association_class,
+    "enumeration": base_delete_enumeration,
+    "enumeration_literal": base_delete_enumeration_literal,
+    "generalization": base_delete_generalization,
+    "ocl_constraint": base_delete_ocl_constraint,
+}
+
+
+def base_delete_batch(
+        logger,
+        domain_model: DomainModel,
+        operations: list[dict],
+) -> DomainModel | str:
+    """Applies several deletions to a B-UML DomainModel in a single pass.
+
+    Args:
+        domain_model (DomainModel): The B-UML domain model.
+        operations (list[dict]): The deletions to apply, in order. Each one has a "kind" key
+            (class, method, attribute, binary_association, association_class, enumeration,
+            enumeration_literal, generalization or ocl_constraint) and the arguments of the
+            matching single deletion tool, e.g. {"kind": "method", "name": "m", "class_name": "A"}.
+
+    Returns:
+        DomainModel | str: The updated domain model, or the error message of the first failing deletion.
+            On error, `domain_model` may already hold the deletions that came before the failing one.
+    """
+    logger.info(f"Applying {len(operations)} deletions to domain model")
+
+    for index, operation in enumerate(operations):
+        try:
+            arguments = dict(operation)
+            kind = arguments.pop("kind", None)
+            base_delete = _DELETIONS.get(kind)
+            if base_delete is None:
+                return f"Error in deletion #{index}: Unknown kind '{kind}', expected one of {', '.join(_DELETIONS)}"
+
+            domain_model = base_delete(logger, domain_model, **arguments)
+        except Exception as e:
+            return f"Error in deletion #{index}: {str(e)}"
+
+        if isinstance(domain_model, str):
+            return f"Error in deletion #{index} ({kind}): {domain_model}"
+
+    # Return the updated model
+    return domain_model
+
+
+def _delete_from_base64(logger, base_delete, domain_model_base64: str, *args) -> str:
+    """Run `base_delete` on a base64 model and return the updated model as base64, or an error message."""
+    known_failure = _known_failure(domain_model_base64, base_delete, args)
+    if known_failure is not None:
+        return known_failure
+
+    # Deserialize the domain model
+    domain_model = deserialize_domain_model(domain_model_base64)
+
+    domain_model = base_delete(logger, domain_model, *args)
+
+    if isinstance(domain_model, str):
+        _remember_failure(domain_model_base64, base_delete, args, domain_model)
+        return domain_model
+
+    if not _pop_dirty(domain_model):
+        # Nothing was removed, the input model is still up to date
+        return domain_model_base64
+
+    # Return the updated model as base64
+    return serialize_domain_model(domain_model)
+
+
+def _delete_with_url(logger, base_delete, domain_model_url: str, *args) -> str:
+    """Run `base_delete` on the model stored at `domain_model_url` and upload the result."""
+    # Get the model
+    serialized_model = download_model_from(domain_model_url)
+
+    known_failure = _known_failure(serialized_model, base_delete, args)
+    if known_failure is not None:
+        return known_failure
+
+    # Deserialize the domain model
+    domain_model = deserialize_domain_model(serialized_model)
+
+    domain_model = base_delete(logger, domain_model, *args)
+
+    if isinstance(domain_model, str):
+        _remember_failure(serialized_model, base_delete, args, domain_model)
+        return domain_model
+
+    if not _pop_dirty(domain_model):
+        # Nothing was removed, skip the re-upload
+        return "Success"
+
+    # Return the updated model as base64
+    serialized_model = serialize_domain_model(domain_model)
+    # Upload the model
+    upload_model_to(serialized_model, domain_model_url)
+    return "Success"
+
+
+def _delete_local(logger, base_delete, *args, rollback: bool = False) -> str:
+    """Run `base_delete` on the in-process model and save the result.
+
+    With `rollback`, `base_delete` works on a copy that only replaces the in-process model
+    on success, so a failure half way through leaves it untouched.
+    """
+    # Get the model
+    domain_model = get_model()
+    if rollback:
+        domain_model = copy.deepcopy(domain_model)
+
+    domain_model = base_delete(logger, domain_model, *args)
 
+    if isinstance(domain_model, str):
+        return domain_model
 
+    if _pop_dirty(domain_model):
+        save_model(domain_model)
+    return "Success"
 
 
 def register_base64_deletion_tools(mcp, logger):
@@ -388,17 +575,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_class(logger,domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
+        return _delete_from_base64(logger, base_delete_class, domain_model_base64, name)
 
     @mcp.tool()
     def delete_method_from_class_base64(
@@ -417,17 +594,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_method_from_class(logger, domain_model, name, class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
+        return _delete_from_base64(logger, base_delete_method_from_class, domain_model_base64, name, class_name)
 
     @mcp.tool()
     def delete_attribute_from_class_base64(
@@ -446,19 +613,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_attribute_from_class(logger, domain_model, name, class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
-
-
+        return _delete_from_base64(logger, base_delete_attribute_from_class, domain_model_base64, name, class_name)
 
     @mcp.tool()
     def delete_binary_association_base64(
@@ -475,18 +630,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_binary_association(logger,domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
-
+        return _delete_from_base64(logger, base_delete_binary_association, domain_model_base64, name)
 
     @mcp.tool()
     def delete_association_class_base64(
@@ -503,18 +647,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_association_class(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
-
+        return _delete_from_base64(logger, base_delete_association_class, domain_model_base64, name)
 
     @mcp.tool()
     def delete_enumeration_base64(
@@ -531,18 +664,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_enumeration(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
-
+        return _delete_from_base64(logger, base_delete_enumeration, domain_model_base64, name)
 
     @mcp.tool()
     def delete_enumeration_literal_base64(
@@ -561,18 +683,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_enumeration_literal(logger, domain_model, name, enumeration_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
-
-
+        return _delete_from_base64(logger, base_delete_enumeration_literal, domain_model_base64, name, enumeration_name)
 
     @mcp.tool()
     def delete_generalization_base64(
@@ -591,16 +702,7 @@ def register_base64_deletion_tools(mcp, logger):
             str: The updated domain model as base64 string, or an error message
                  if a class with the same name already exists.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_generalization(logger, domain_model, general_class_name, specific_class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
+        return _delete_from_base64(logger, base_delete_generalization, domain_model_base64, general_class_name, specific_class_name)
 
     @mcp.tool()
     def delete_ocl_constraint_base64(
@@ -616,22 +718,31 @@ def register_base64_deletion_tools(mcp, logger):
         Returns:
             str: The updated domain model as base64 string, or an error message.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-
-        domain_model = base_delete_ocl_constraint(logger, domain_model, name)
+        return _delete_from_base64(logger, base_delete_ocl_constraint, domain_model_base64, name)
 
-        if isinstance(domain_model, str):
-            return domain_model
+    @mcp.tool()
+    def delete_batch_base64(
+            domain_model_base64: str,
+            operations: list[dict],
+    ) -> str:
+        """Applies several deletions to a B-UML DomainModel at once and returns the updated model as base64.
 
-        # Return the updated model as base64
-        return serialize_domain_model(domain_model)
+        Args:
+            domain_model_base64 (str): The B-UML domain model as base64 string.
+            operations (list[dict]): The deletions to apply, in order. Each one has a "kind" key
+                (class, method, attribute, binary_association, association_class, enumeration,
+                enumeration_literal, generalization or ocl_constraint) and the arguments of the
+                matching single deletion tool, e.g. {"kind": "method", "name": "m", "class_name": "A"}.
 
+        Returns:
+            str: The updated domain model as base64 string, or the error message of the first failing deletion.
+        """
+        return _delete_from_base64(logger, base_delete_batch, domain_model_base64, operations)
 
 
 def register_url_deletion_tools(mcp, logger):
     @mcp.tool()
-    def delete_class_with_url(
+    async def delete_class_with_url(
             domain_model_url: str,
             name: str,
     ) -> str:
@@ -644,24 +755,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_class(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_class, domain_model_url, name)
 
     @mcp.tool()
-    def delete_method_from_class_with_url(
+    async def delete_method_from_class_with_url(
             domain_model_url: str,
             name: str,
             class_name: str
@@ -676,24 +773,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_method_from_class(logger, domain_model, name, class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_method_from_class, domain_model_url, name, class_name)
 
     @mcp.tool()
-    def delete_attribute_from_class_with_url(
+    async def delete_attribute_from_class_with_url(
             domain_model_url: str,
             name: str,
             class_name: str
@@ -708,24 +791,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_attribute_from_class(logger, domain_model, name, class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_attribute_from_class, domain_model_url, name, class_name)
 
     @mcp.tool()
-    def delete_binary_association_with_url(
+    async def delete_binary_association_with_url(
             domain_model_url: str,
             name: str
     ) -> str:
@@ -738,24 +807,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_binary_association(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_binary_association, domain_model_url, name)
 
     @mcp.tool()
-    def delete_association_class_with_url(
+    async def delete_association_class_with_url(
             domain_model_url: str,
             name: str
     ) -> str:
@@ -768,24 +823,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_association_class(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_association_class, domain_model_url, name)
 
     @mcp.tool()
-    def delete_enumeration_with_url(
+    async def delete_enumeration_with_url(
             domain_model_url: str,
             name: str
     ) -> str:
@@ -798,24 +839,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_enumeration(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_enumeration, domain_model_url, name)
 
     @mcp.tool()
-    def delete_enumeration_literal_with_url(
+    async def delete_enumeration_literal_with_url(
             domain_model_url: str,
             name: str,
             enumeration_name: str
@@ -830,24 +857,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_enumeration_literal(logger, domain_model, name, enumeration_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_enumeration_literal, domain_model_url, name, enumeration_name)
 
     @mcp.tool()
-    def delete_generalization_with_url(
+    async def delete_generalization_with_url(
             domain_model_url: str,
             general_class_name: str,
             specific_class_name: str
@@ -862,24 +875,10 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
-
-        domain_model = base_delete_generalization(logger, domain_model, general_class_name, specific_class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_generalization, domain_model_url, general_class_name, specific_class_name)
 
     @mcp.tool()
-    def delete_ocl_constraint_with_url(
+    async def delete_ocl_constraint_with_url(
             domain_model_url: str,
             name: str,
     ) -> str:
@@ -892,22 +891,26 @@ def register_url_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        serialized_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_model)
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_ocl_constraint, domain_model_url, name)
 
-        domain_model = base_delete_ocl_constraint(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
+    @mcp.tool()
+    async def delete_batch_with_url(
+            domain_model_url: str,
+            operations: list[dict],
+    ) -> str:
+        """Applies several deletions to a B-UML DomainModel at once.
 
-        # Return the updated model as base64
-        serialized_model = serialize_domain_model(domain_model)
-        # Upload the model
-        upload_model_to(serialized_model, domain_model_url)
-        return "Success"
+        Args:
+            domain_model_url (str): The B-UML domain model URL location.
+            operations (list[dict]): The deletions to apply, in order. Each one has a "kind" key
+                (class, method, attribute, binary_association, association_class, enumeration,
+                enumeration_literal, generalization or ocl_constraint) and the arguments of the
+                matching single deletion tool, e.g. {"kind": "method", "name": "m", "class_name": "A"}.
 
+        Returns:
+            str: 'Success' or the error message of the first failing deletion
+        """
+        return await asyncio.to_thread(_delete_with_url, logger, base_delete_batch, domain_model_url, operations)
 
 
 def register_deletion_tools(mcp, logger):
@@ -923,16 +926,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_class(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_class, name)
 
     @mcp.tool()
     def delete_method_from_class(
@@ -948,16 +942,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_method_from_class(logger, domain_model, name, class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_method_from_class, name, class_name)
 
     @mcp.tool()
     def delete_attribute_from_class(
@@ -973,16 +958,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_attribute_from_class(logger, domain_model, name, class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_attribute_from_class, name, class_name)
 
     @mcp.tool()
     def delete_binary_association(
@@ -996,16 +972,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_binary_association(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_binary_association, name)
 
     @mcp.tool()
     def delete_association_class(
@@ -1019,16 +986,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_association_class(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_association_class, name)
 
     @mcp.tool()
     def delete_enumeration(
@@ -1042,16 +1000,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_enumeration(logger, domain_model, name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_enumeration, name)
 
     @mcp.tool()
     def delete_enumeration_literal(
@@ -1067,16 +1016,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_enumeration_literal(logger, domain_model, name, enumeration_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
+        return _delete_local(logger, base_delete_enumeration_literal, name, enumeration_name)
 
     @mcp.tool()
     def delete_generalization(
@@ -1092,18 +1032,7 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
-
-        domain_model = base_delete_generalization(logger, domain_model, general_class_name, specific_class_name)
-
-        if isinstance(domain_model, str):
-            return domain_model
-
-        save_model(domain_model)
-        return "Success"
-
-
+        return _delete_local(logger, base_delete_generalization, general_class_name, specific_class_name)
 
     @mcp.tool()
     def delete_ocl_constraint(
@@ -1117,13 +1046,21 @@ def register_deletion_tools(mcp, logger):
         Returns:
             str: 'Success' or an error message
         """
-        # Get the model
-        domain_model = get_model()
+        return _delete_local(logger, base_delete_ocl_constraint, name)
 
-        domain_model = base_delete_ocl_constraint(logger, domain_model, name)
+    @mcp.tool()
+    def delete_batch(
+            operations: list[dict],
+    ) -> str:
+        """Applies several deletions to a B-UML DomainModel at once.
 
-        if isinstance(domain_model, str):
-            return domain_model
+        Args:
+            operations (list[dict]): The deletions to apply, in order. Each one has a "kind" key
+                (class, method, attribute, binary_association, association_class, enumeration,
+                enumeration_literal, generalization or ocl_constraint) and the arguments of the
+                matching single deletion tool, e.g. {"kind": "method", "name": "m", "class_name": "A"}.
 
-        save_model(domain_model)
-        return "Success"
\ No newline at end of file
+        Returns:
+            str: 'Success' or the error message of the first failing deletion
+        """
+        return _delete_local(logger, base_delete_batch, operations, rollback=True)
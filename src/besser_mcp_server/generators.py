@@ -1,7 +1,48 @@
+import asyncio
+import functools
+import importlib
 import os
-
-from besser.BUML.metamodel.structural import DomainModel
-from utils import deserialize_domain_model, download_model_from, get_model
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from besser.BUML.metamodel.structural import DomainModel, Enumeration, Property
+from utils import decode_domain_model, download_model_from, get_model
+
+
+# Generator name -> (module, class name, label used in error messages)
+_GENERATORS = {
+    "sql": ("besser.generators.sql.sql_generator", "SQLGenerator", "SQL"),
+    "python": ("besser.generators.python_classes.python_classes_generator", "PythonGenerator", "Python"),
+    "backend": ("besser.generators.backend.backend_generator", "BackendGenerator", "Backend"),
+    "java": ("besser.generators.java_classes.java_generator", "JavaGenerator", "Java"),
+    "json": ("besser.generators.json.json_schema_generator", "JSONSchemaGenerator", "JSON Schema"),
+    "pydantic": ("besser.generators.pydantic_classes.pydantic_classes_generator", "PydanticGenerator", "Pydantic"),
+    "rdf": ("besser.generators.rdf.rdf_generator", "RDFGenerator", "RDF"),
+    "rest_api": ("besser.generators.rest_api.rest_api_generator", "RESTAPIGenerator", "RESTAPI"),
+    "sql_alchemy": ("besser.generators.sql_alchemy.sql_alchemy_generator", "SQLAlchemyGenerator", "SQLAlchemy"),
+}
+
+
+# Outputs of the file generators, keyed by (payload, kind, sql_dialect). Bounded by the
+# size of the payloads and outputs it holds rather than by a number of entries, since a
+# single model can weigh megabytes. Shared by the tool threads, hence the lock.
+_OUTPUTS_MAX_BYTES = 16 * 1024 * 1024
+_outputs: OrderedDict = OrderedDict()
+_outputs_bytes = 0
+_outputs_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _get_generator(name: str):
+    """Import the generator class registered under `name` on first use and return it."""
+    module_name, class_name, label = _GENERATORS[name]
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except ImportError as exc:
+        raise RuntimeError(
+            f"BESSER library with {label} generator must be installed (`pip install besser`)."
+        ) from exc
 
 
 def base_sql_generation(domain_model: DomainModel, sql_dialect: str = "sqlite", path: str = "."):
@@ -13,42 +54,32 @@ def base_sql_generation(domain_model: DomainModel, sql_dialect: str = "sqlite",
         path (str): The generation path
 
     """
-    try:
-        from besser.generators.sql.sql_generator import SQLGenerator  # type: ignore
-        from besser.BUML.metamodel.structural import Property  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with SQL generator must be installed (`pip install besser`)."
-        ) from exc
+    SQLGenerator = _get_generator("sql")
 
     try:
         # Check every class in the domain model and ensure it has at least one attribute
-        classes = domain_model.get_classes()
+        empty_classes = [cls for cls in domain_model.get_classes() if not cls.attributes]
 
-        for cls in classes:
-            if not cls.attributes:
+        # Get the integer primitive type from the domain model, only if some class needs an id
+        int_type = next((data_type for data_type in domain_model.types
+                         if getattr(data_type, 'name', None) == 'int'), None) if empty_classes else None
+
+        if int_type:
+            for cls in empty_classes:
                 # Add an "id" attribute of type integer if the class has no attributes
                 try:
-                    # Get the integer primitive type from the domain model
-                    int_type = None
-                    for data_type in domain_model.types:
-                        if hasattr(data_type, 'name') and data_type.name == 'int':
-                            int_type = data_type
-                            break
-
-                    if int_type:
-                        # Create the "id" property with integer type
-                        id_property = Property(
-                            name="id",
-                            type=int_type,
-                            multiplicity="1",  # Single value
-                            is_id=True  # Mark as identifier
-                        )
-
-                        # Add the property to the class
-                        cls.attributes.add(id_property)
-
-                except Exception as e:
+                    # Create the "id" property with integer type
+                    id_property = Property(
+                        name="id",
+                        type=int_type,
+                        multiplicity="1",  # Single value
+                        is_id=True  # Mark as identifier
+                    )
+
+                    # Add the property to the class
+                    cls.attributes.add(id_property)
+
+                except ValueError:
                     # If we can't add the attribute, continue without it
                     # This ensures the tool doesn't fail completely
                     pass
@@ -72,12 +103,7 @@ def base_python_generation(domain_model: DomainModel, path: str = "."):
     Returns:
         str: Python representation of the domain model, or an error message if generation fails.
     """
-    try:
-        from besser.generators.python_classes.python_classes_generator import PythonGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with Python generator must be installed (`pip install besser`)."
-        ) from exc
+    PythonGenerator = _get_generator("python")
 
     try:
         # Create Python generator instance and generate Python
@@ -96,12 +122,7 @@ def base_backend_generation(domain_model: DomainModel, path:str = "."):
         domain_model (DomainModel): The B-UML domain model.
         path (str) : the generation path
     """
-    try:
-        from besser.generators.backend.backend_generator import BackendGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with Backend generator must be installed (`pip install besser`)."
-        ) from exc
+    BackendGenerator = _get_generator("backend")
 
     try:
         # Create Backend generator instance and generate the backend
@@ -120,12 +141,7 @@ def base_java_generation(domain_model: DomainModel, path:str = "."):
         domain_model (DomainModel): The B-UML domain model.
         path (str) : the generation path
     """
-    try:
-        from besser.generators.java_classes.java_generator import JavaGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with Java generator must be installed (`pip install besser`)."
-        ) from exc
+    JavaGenerator = _get_generator("java")
 
     try:
         # Create Java generator instance and generate Java
@@ -144,12 +160,7 @@ def base_json_generation(domain_model: DomainModel, path:str = ".", mode="regula
         path (str) : the generation path
         mode (str) : mode of generation (regular or smart_data)
     """
-    try:
-        from besser.generators.json.json_schema_generator import JSONSchemaGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with Backend generator must be installed (`pip install besser`)."
-        ) from exc
+    JSONSchemaGenerator = _get_generator("json")
 
     try:
         # Create JSONSchema generator instance and generate JSON Schema
@@ -168,12 +179,7 @@ def base_pydantic_classes_generation(domain_model: DomainModel, path:str = "."):
         domain_model (DomainModel): The B-UML domain model.
         path (str) : the generation path
     """
-    try:
-        from besser.generators.pydantic_classes.pydantic_classes_generator import PydanticGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with Pydantic generator must be installed (`pip install besser`)."
-        ) from exc
+    PydanticGenerator = _get_generator("pydantic")
 
     try:
         # Create Pydantic generator instance and generate Pydantic
@@ -191,12 +197,7 @@ def base_rdf_generation(domain_model: DomainModel, path:str = "."):
         domain_model (DomainModel): The B-UML domain model.
         path (str) : the generation path
     """
-    try:
-        from besser.generators.rdf.rdf_generator import RDFGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with RDF generator must be installed (`pip install besser`)."
-        ) from exc
+    RDFGenerator = _get_generator("rdf")
 
     try:
         # Create RDF generator instance and generate RDF
@@ -214,12 +215,7 @@ def base_rest_api_generation(domain_model: DomainModel, path:str = "."):
         domain_model (DomainModel): The B-UML domain model.
         path (str) : the generation path
     """
-    try:
-        from besser.generators.rest_api.rest_api_generator import RESTAPIGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with RESTAPI generator must be installed (`pip install besser`)."
-        ) from exc
+    RESTAPIGenerator = _get_generator("rest_api")
 
     try:
         # Create RESTAPI generator instance and generate RESTAPI
@@ -237,12 +233,7 @@ def base_sql_alchemy_generation(domain_model: DomainModel, path:str = "."):
         domain_model (DomainModel): The B-UML domain model.
         path (str) : the generation path
     """
-    try:
-        from besser.generators.sql_alchemy.sql_alchemy_generator import SQLAlchemyGenerator  # type: ignore
-    except ImportError as exc:
-        raise RuntimeError(
-            "BESSER library with SQLAlchemy generator must be installed (`pip install besser`)."
-        ) from exc
+    SQLAlchemyGenerator = _get_generator("sql_alchemy")
 
     try:
         # Create SQLAlchemy generator instance and generate SQLAlchemy
@@ -253,9 +244,167 @@ def base_sql_alchemy_generation(domain_model: DomainModel, path:str = "."):
         # Return error message if SQLAlchemy generation fails
         return f"Error generating SQLAlchemy from domain model: {str(e)}"
 
+def _capture_generator_output(generate, filename: str) -> str | None:
+    """Run `generate` into a private temporary directory and return the content of `filename`.
+
+    Args:
+        generate (Callable[[str], str | None]): Runs the generator into the given directory and
+            returns an error message on failure.
+        filename (str): Name of the generated file to read back.
+
+    Returns:
+        str | None: The generated content, or None if the generator did not produce `filename`.
+
+    Raises:
+        RuntimeError: If the generator reports an error.
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        out = generate(output_dir)
+        if out is not None:
+            raise RuntimeError(out)
+        output_file = os.path.join(output_dir, filename)
+        if not os.path.isfile(output_file):
+            return None
+        with open(output_file, "r", encoding="utf-8") as f:
+            return f.read()
+
+
+def _generate_content(domain_model: DomainModel, base_generation, filename: str, noun: str,
+                      requirements: str = "generation requirements", **kwargs) -> str:
+    """Run `base_generation` on a domain model and return the content of the generated `filename`.
+
+    Args:
+        domain_model (DomainModel): The B-UML domain model.
+        base_generation (Callable): One of the base_*_generation functions.
+        filename (str): Name of the file produced by the generator.
+        noun (str): What is generated, used in the messages (e.g. "SQL").
+        requirements (str): What the classes may fail to meet, used in the messages.
+        **kwargs: Extra arguments for `base_generation`.
+
+    Returns:
+        str: The generated content, or an explanation of why nothing was generated.
+
+    Raises:
+        RuntimeError: If the generator is not installed or reports an error.
+    """
+    classes = domain_model.get_classes()
+    if not classes and not any(isinstance(t, Enumeration) for t in domain_model.types):
+        # Neither classes nor enumerations, nothing to generate: do not pay for the generator run
+        return f"No {noun} generated. The domain model contains no classes."
+
+    content = _capture_generator_output(
+        lambda path: base_generation(domain_model, path=path, **kwargs), filename)
+    if content is not None:
+        return content
+
+    # Try to provide more detailed information about why nothing was generated
+    if not classes:
+        return f"No {noun} generated. The domain model contains no classes."
+    classes_info = ", ".join(f"{cls.name} ({len(cls.attributes)} attributes)" for cls in classes)
+    return f"No {noun} generated. The domain model contains {len(classes)} class(es): {classes_info}. The {noun} generator may require additional configuration or the classes may not meet {requirements}."
+
+
+def _file_generation_specs(sql_dialect: str) -> dict:
+    """Return, for each file generator kind, its base function, output file, noun, requirements and extra arguments."""
+    return {
+        "sql": (base_sql_generation, f"tables_{sql_dialect}", "SQL", "SQL generation requirements",
+                {"sql_dialect": sql_dialect}),
+        "python": (base_python_generation, "classes.py", "Python code", "generation requirements", {}),
+        "json_schema": (base_json_generation, "schema.json", "JSON Schema", "generation requirements", {}),
+        "rdf": (base_rdf_generation, "vocabulary.ttl", "RDF Vocabulary", "generation requirements", {}),
+    }
+
+
+def _cached_output(key: tuple) -> str | None:
+    """Return the output remembered for `key`, or None."""
+    with _outputs_lock:
+        content = _outputs.get(key)
+        if content is not None:
+            _outputs.move_to_end(key)
+        return content
+
+
+def _remember_output(key: tuple, content: str):
+    """Remember a generator output, evicting the oldest ones beyond `_OUTPUTS_MAX_BYTES`."""
+    global _outputs_bytes
+    size = len(key[0]) + len(content)
+    if size > _OUTPUTS_MAX_BYTES:
+        return
+    with _outputs_lock:
+        if key in _outputs:
+            return
+        _outputs[key] = content
+        _outputs_bytes += size
+        while _outputs_bytes > _OUTPUTS_MAX_BYTES:
+            old_key, old_content = _outputs.popitem(last=False)
+            _outputs_bytes -= len(old_key[0]) + len(old_content)
+
+
+def _generate_from_payload(serialized_model: str, kind: str, sql_dialect: str = "sqlite") -> str:
+    """Run one file generator on a serialized domain model and return its output.
+
+    A payload always describes the same model and the generators are deterministic,
+    so the output of a previous identical request is reused instead of running BESSER again.
+    Failures are not remembered, the next identical request runs the generator again.
+
+    Args:
+        serialized_model (str): The B-UML domain model as base64 string.
+        kind (str): The generator to run, among sql, python, json_schema and rdf.
+        sql_dialect (str) : The SQL dialect of the SQL output (default sqlite).
+
+    Returns:
+        str: The generated content, or an error message.
+    """
+    specs = _file_generation_specs(sql_dialect)
+    if kind not in specs:
+        return f"Error: Unknown generator '{kind}', expected one of {', '.join(specs)}"
+
+    key = (serialized_model, kind, sql_dialect)
+    content = _cached_output(key)
+    if content is not None:
+        return content
+
+    base_generation, filename, noun, requirements, kwargs = specs[kind]
+    # Every run works on its own model: generators may modify it (base_sql_generation adds ids).
+    # A model kept for this payload is left in place for the next call.
+    domain_model = decode_domain_model(serialized_model)
+    try:
+        content = _generate_content(domain_model, base_generation, filename, noun, requirements, **kwargs)
+    except RuntimeError as e:
+        # Report a missing generator or a failed run for this kind without failing the other ones
+        return str(e)
+
+    _remember_output(key, content)
+    return content
+
+
+def _generate_many(serialized_model: str, kinds: list[str], sql_dialect: str = "sqlite") -> dict[str, str]:
+    """Run several file generators on a serialized domain model in parallel threads.
+
+    Args:
+        serialized_model (str): The B-UML domain model as base64 string.
+        kinds (list[str]): The generators to run, among sql, python, json_schema and rdf.
+        sql_dialect (str) : The SQL dialect of the SQL output (default sqlite).
+
+    Returns:
+        dict[str, str]: The generated content (or error message) of each requested generator.
+    """
+    def generate(kind: str) -> str:
+        try:
+            return _generate_from_payload(serialized_model, kind, sql_dialect)
+        except Exception as e:
+            # Report the failure of this kind without failing the other ones
+            return f"Error generating {kind} from domain model: {str(e)}"
+
+    # Every generator writes into its own temporary directory, so they can run side by side
+    kinds = list(dict.fromkeys(kinds))
+    with ThreadPoolExecutor(max_workers=len(kinds) or 1) as executor:
+        return dict(zip(kinds, executor.map(generate, kinds)))
+
+
 def register_base64_generator_tools(mcp, logger):
     @mcp.tool()
-    def sql_generation_base64(domain_model_base64: str, sql_dialect: str = "sqlite") -> str:
+    async def sql_generation_base64(domain_model_base64: str, sql_dialect: str = "sqlite") -> str:
         """Given a domain model as base64, it creates a SQL representation of the model.
 
         Args:
@@ -265,36 +414,10 @@ def register_base64_generator_tools(mcp, logger):
         Returns:
             str: SQL representation of the domain model, or an error message if generation fails.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-        out = base_sql_generation(domain_model, sql_dialect)
-        if out is not None:
-            return out
-        try:
-            with open(f"./tables_{sql_dialect}", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove(f"./tables_{sql_dialect}")
-            return content
-
-        except Exception as e:
-            # Try to provide more detailed information about why no SQL was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
-
-            if not classes:
-                return "No SQL generated. The domain model contains no classes."
-            else:
-                return f"No SQL generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The SQL generator may require additional configuration or the classes may not meet SQL generation requirements."
-
-
-
+        return await asyncio.to_thread(_generate_from_payload, domain_model_base64, "sql", sql_dialect)
 
     @mcp.tool()
-    def python_generation_base64(domain_model_base64: str) -> str:
+    async def python_generation_base64(domain_model_base64: str) -> str:
         """Given a domain model as base64, it creates a set of python classes implementing the model.
 
         Args:
@@ -303,33 +426,10 @@ def register_base64_generator_tools(mcp, logger):
         Returns:
             str: Python representation of the domain model, or an error message if generation fails.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-        out = base_python_generation(domain_model)
-        if out is not None:
-            return out
-        try:
-            with open("./classes.py", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove("./classes.py")
-            return content
-
-        except Exception as e:
-            # Try to provide more detailed information about why no Python was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
-
-            if not classes:
-                return "No Python code generated. The domain model contains no classes."
-            else:
-                return f"No Python code generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The Python code generator may require additional configuration or the classes may not meet generation requirements."
+        return await asyncio.to_thread(_generate_from_payload, domain_model_base64, "python")
 
     @mcp.tool()
-    def json_schema_generation_base64(domain_model_base64: str) -> str:
+    async def json_schema_generation_base64(domain_model_base64: str) -> str:
         """Given a domain model as base64, creates the JSON Schema representing the model.
 
         Args:
@@ -338,33 +438,10 @@ def register_base64_generator_tools(mcp, logger):
         Returns:
             str: JSON schema of the domain model, or an error message if generation fails.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-        out = base_json_generation(domain_model)
-        if out is not None:
-            return out
-        try:
-            with open("./schema.json", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove("./schema.json")
-            return content
-
-        except Exception as e:
-            # Try to provide more detailed information about why no JSON Schema was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
-
-            if not classes:
-                return "No JSON Schema generated. The domain model contains no classes."
-            else:
-                return f"No JSON Schema generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The JSON Schema generator may require additional configuration or the classes may not meet generation requirements."
+        return await asyncio.to_thread(_generate_from_payload, domain_model_base64, "json_schema")
 
     @mcp.tool()
-    def rdf_generation_base64(domain_model_base64: str) -> str:
+    async def rdf_generation_base64(domain_model_base64: str) -> str:
         """Given a domain model as base64, it creates the RDF Vocabulary for the model.
 
         Args:
@@ -373,35 +450,26 @@ def register_base64_generator_tools(mcp, logger):
         Returns:
             str: RDF Vocabulary of the domain model, or an error message if generation fails.
         """
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(domain_model_base64)
-        out = base_rdf_generation(domain_model)
-        if out is not None:
-            return out
-        try:
-            with open("./vocabulary.ttl", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove("./vocabulary.ttl")
-            return content
+        return await asyncio.to_thread(_generate_from_payload, domain_model_base64, "rdf")
 
-        except Exception as e:
-            # Try to provide more detailed information about why no RDF was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
+    @mcp.tool()
+    async def multi_generation_base64(domain_model_base64: str, kinds: list[str], sql_dialect: str = "sqlite") -> dict[str, str]:
+        """Given a domain model as base64, runs several generators on it at once.
 
-            if not classes:
-                return "No RDF Vocabulary generated. The domain model contains no classes."
-            else:
-                return f"No RDF Vocabulary generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The RDF Vocabulary generator may require additional configuration or the classes may not meet generation requirements."
+        Args:
+            domain_model_base64 (str): The B-UML domain model as base64 string.
+            kinds (list[str]): The generators to run, among sql, python, json_schema and rdf.
+            sql_dialect (str) : The SQL dialect of the SQL output (default sqlite).
+
+        Returns:
+            dict[str, str]: The output of each requested generator, or its error message.
+        """
+        return await asyncio.to_thread(_generate_many, domain_model_base64, kinds, sql_dialect)
 
 
 def register_url_generator_tools(mcp, logger):
     @mcp.tool()
-    def sql_generation_with_url(domain_model_url: str, sql_dialect: str = "sqlite") -> str:
+    async def sql_generation_with_url(domain_model_url: str, sql_dialect: str = "sqlite") -> str:
         """Given a domain model pointed by the passed URL, it creates a SQL representation of the model.
 
         Args:
@@ -412,37 +480,11 @@ def register_url_generator_tools(mcp, logger):
             str: SQL representation of the domain model, or an error message if generation fails.
         """
         # Get the model
-        serialized_domain_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_domain_model)
-        out = base_sql_generation(domain_model, sql_dialect)
-        if out is not None:
-            return out
-        try:
-            with open(f"./tables_{sql_dialect}", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove(f"./tables_{sql_dialect}")
-            return content
-
-        except Exception as e:
-            # Try to provide more detailed information about why no SQL was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
-
-            if not classes:
-                return "No SQL generated. The domain model contains no classes."
-            else:
-                return f"No SQL generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The SQL generator may require additional configuration or the classes may not meet SQL generation requirements."
-
-
-
+        serialized_domain_model = await asyncio.to_thread(download_model_from, domain_model_url)
+        return await asyncio.to_thread(_generate_from_payload, serialized_domain_model, "sql", sql_dialect)
 
     @mcp.tool()
-    def python_generation_with_url(domain_model_url: str) -> str:
+    async def python_generation_with_url(domain_model_url: str) -> str:
         """Given a domain model pointed by the passed URL, it creates a set of python classes implementing the model.
 
         Args:
@@ -452,34 +494,11 @@ def register_url_generator_tools(mcp, logger):
             str: Python representation of the domain model, or an error message if generation fails.
         """
         # Get the model
-        serialized_domain_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_domain_model)
-        out = base_python_generation(domain_model)
-        if out is not None:
-            return out
-        try:
-            with open("./classes.py", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove("./classes.py")
-            return content
-
-        except Exception as e:
-            # Try to provide more detailed information about why no Python was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
-
-            if not classes:
-                return "No Python code generated. The domain model contains no classes."
-            else:
-                return f"No Python code generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The Python code generator may require additional configuration or the classes may not meet generation requirements."
+        serialized_domain_model = await asyncio.to_thread(download_model_from, domain_model_url)
+        return await asyncio.to_thread(_generate_from_payload, serialized_domain_model, "python")
 
     @mcp.tool()
-    def json_schema_generation_with_url(domain_model_url: str) -> str:
+    async def json_schema_generation_with_url(domain_model_url: str) -> str:
         """Given a domain model pointed by the passed URL, creates the JSON Schema representing the model.
 
         Args:
@@ -489,34 +508,11 @@ def register_url_generator_tools(mcp, logger):
             str: JSON schema of the domain model, or an error message if generation fails.
         """
         # Get the model
-        serialized_domain_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_domain_model)
-        out = base_json_generation(domain_model)
-        if out is not None:
-            return out
-        try:
-            with open("./schema.json", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove("./schema.json")
-            return content
-
-        except Exception as e:
-            # Try to provide more detailed information about why no JSON Schema was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
-
-            if not classes:
-                return "No JSON Schema generated. The domain model contains no classes."
-            else:
-                return f"No JSON Schema generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The JSON Schema generator may require additional configuration or the classes may not meet generation requirements."
+        serialized_domain_model = await asyncio.to_thread(download_model_from, domain_model_url)
+        return await asyncio.to_thread(_generate_from_payload, serialized_domain_model, "json_schema")
 
     @mcp.tool()
-    def rdf_generation_with_url(domain_model_url: str) -> str:
+    async def rdf_generation_with_url(domain_model_url: str) -> str:
         """Given a domain model pointed by the passed URL, creates the RDF vocabulary for the model.
 
         Args:
@@ -526,34 +522,30 @@ def register_url_generator_tools(mcp, logger):
             str: RDF vocabulary for the domain model, or an error message if generation fails.
         """
         # Get the model
-        serialized_domain_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_domain_model)
-        out = base_rdf_generation(domain_model)
-        if out is not None:
-            return out
-        try:
-            with open("./vocabulary.ttl", "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            content = "\n".join(lines)
-            os.remove("./vocabulary.ttl")
-            return content
+        serialized_domain_model = await asyncio.to_thread(download_model_from, domain_model_url)
+        return await asyncio.to_thread(_generate_from_payload, serialized_domain_model, "rdf")
 
-        except Exception as e:
-            # Try to provide more detailed information about why no RDF was generated
-            classes = domain_model.get_classes()
-            classes_info = []
-            for cls in classes:
-                attr_count = len(cls.attributes)
-                classes_info.append(f"{cls.name} ({attr_count} attributes)")
+    @mcp.tool()
+    async def multi_generation_with_url(domain_model_url: str, kinds: list[str], sql_dialect: str = "sqlite") -> dict[str, str]:
+        """Given a domain model pointed by the passed URL, runs several generators on it at once.
 
-            if not classes:
-                return "No RDF vocabulary generated. The domain model contains no classes."
-            else:
-                return f"No RDF vocabulary generated. The domain model contains {len(classes)} class(es): {', '.join(classes_info)}. The RDF vocabulary generator may require additional configuration or the classes may not meet generation requirements."
+        Args:
+            domain_model_url (str): The B-UML domain model URL location.
+            kinds (list[str]): The generators to run, among sql, python, json_schema and rdf.
+            sql_dialect (str) : The SQL dialect of the SQL output (default sqlite).
+
+        Returns:
+            dict[str, str]: The output of each requested generator, or its error message.
+        """
+        # Get the model
+        serialized_domain_model = await asyncio.to_thread(download_model_from, domain_model_url)
+        return await asyncio.to_thread(_generate_many, serialized_domain_model, kinds, sql_dialect)
 
 
 def register_generator_tools(mcp, logger):
+    # These tools stay synchronous: they work on the single shared model that the
+    # local creation and deletion tools mutate on the event loop, and
+    # base_sql_generation itself adds id attributes to it.
     @mcp.tool()
     def sql_generation(sql_dialect: str = "sqlite", output_dir: str = "."):
         """Creates a SQL representation of the model.
@@ -567,7 +559,6 @@ def register_generator_tools(mcp, logger):
         out = base_sql_generation(domain_model, sql_dialect, path=output_dir)
         return "Success" if out is None else out
 
-
     @mcp.tool()
     def python_generation(output_dir: str = "."):
         """Creates a set of python classes implementing the model.
@@ -592,7 +583,6 @@ def register_generator_tools(mcp, logger):
         out = base_backend_generation(domain_model, output_dir)
         return "Success" if out is None else out
 
-
     @mcp.tool()
     def java_generation(output_dir: str = "."):
         """Creates a set of Java classes implementing the model.
@@ -605,7 +595,6 @@ def register_generator_tools(mcp, logger):
         out = base_java_generation(domain_model, output_dir)
         return "Success" if out is None else out
 
-
     @mcp.tool()
     def json_schema_generation(output_dir: str = "."):
         """Creates a JSON schema for the model.
@@ -642,7 +631,6 @@ def register_generator_tools(mcp, logger):
         out = base_pydantic_classes_generation(domain_model, output_dir)
         return "Success" if out is None else out
 
-
     @mcp.tool()
     def rdf_generation(output_dir: str = "."):
         """Generates the RDF vocabulary for the model.
@@ -655,7 +643,6 @@ def register_generator_tools(mcp, logger):
         out = base_rdf_generation(domain_model, output_dir)
         return "Success" if out is None else out
 
-
     @mcp.tool()
     def rest_api_generation(output_dir: str = "."):
         """Generate the Rest API domain model code.
@@ -668,7 +655,6 @@ def register_generator_tools(mcp, logger):
         out = base_rest_api_generation(domain_model, output_dir)
         return "Success" if out is None else out
 
-
     @mcp.tool()
     def sql_alchemy_generation(output_dir: str = "."):
         """Generate the SQLAlchemy code for the model.
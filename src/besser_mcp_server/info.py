@@ -1,3 +1,5 @@
+import asyncio
+
 from besser.BUML.metamodel.structural import DomainModel
 from utils import deserialize_domain_model, download_model_from, get_model
 
@@ -9,6 +11,14 @@ def base_about() -> str:
         "It provides modeling capabilities and code generation tools to help developers build software faster.\n\n"
         "Learn more about BESSER at: https://github.com/BESSER-PEARL/BESSER")
 
+def _format_class_info(cls) -> str:
+    """Format the summary line of a class followed by one line per attribute."""
+    attributes = cls.attributes
+    return "\n".join([
+        f"  - {cls.name} ({len(attributes)} attributes)",
+        *(f"    * {attr.name}: {attr.type.name if hasattr(attr.type, 'name') else str(attr.type)}" for attr in attributes),
+    ])
+
 def base_get_model_info(logger, domain_model: DomainModel) -> str:
     """Get detailed information about a domain model.
 
@@ -22,28 +32,32 @@ def base_get_model_info(logger, domain_model: DomainModel) -> str:
         logger.info("Getting model info")
         classes = domain_model.get_classes()
 
-        info = [f"Domain Model: {domain_model.name}"]
-        info.append(f"Total types: {len(domain_model.types)}")
-        info.append(f"Classes: {len(classes)}")
+        info = [
+            f"Domain Model: {domain_model.name}",
+            f"Total types: {len(domain_model.types)}",
+            f"Classes: {len(classes)}",
+        ]
 
         if classes:
             info.append("Class details:")
-            for cls in classes:
-                info.append(f"  - {cls.name} ({len(cls.attributes)} attributes)")
-                for attr in cls.attributes:
-                    attr_type = attr.type.name if hasattr(attr.type, 'name') else str(attr.type)
-                    info.append(f"    * {attr.name}: {attr_type}")
+            info.extend(_format_class_info(cls) for cls in classes)
 
         return "\n".join(info)
     except Exception as e:
         return f"Error getting model info: {str(e)}"
 
-def register_base64_info_tools(mcp, logger):
+def _get_serialized_model_info(logger, serialized_domain_model: str) -> str:
+    """Get the information of a serialized domain model."""
+    domain_model = deserialize_domain_model(serialized_domain_model, shared=True)
+    return base_get_model_info(logger, domain_model)
+
+def register_about_tool(mcp):
     @mcp.tool()
     def about() -> str:
         """Get information about BESSER and this MCP server."""
         return base_about()
 
+def register_base64_info_tools(mcp, logger):
     @mcp.tool()
     def get_base64_model_info(domain_model_base64: str) -> str:
         """Get detailed information about a domain model.
@@ -54,17 +68,11 @@ def register_base64_info_tools(mcp, logger):
         Returns:
             str: Detailed information about the domain model.
         """
-        domain_model = deserialize_domain_model(domain_model_base64)
-        return base_get_model_info(logger, domain_model)
+        return _get_serialized_model_info(logger, domain_model_base64)
 
 def register_url_info_tools(mcp, logger):
     @mcp.tool()
-    def about() -> str:
-        """Get information about BESSER and this MCP server."""
-        return base_about()
-
-    @mcp.tool()
-    def get_model_info_with_url(domain_model_url: str) -> str:
+    async def get_model_info_with_url(domain_model_url: str) -> str:
         """Get detailed information about a domain model.
 
         Args:
@@ -74,17 +82,10 @@ def register_url_info_tools(mcp, logger):
             str: Detailed information about the domain model.
         """
         # Get the model
-        serialized_domain_model = download_model_from(domain_model_url)
-        # Deserialize the domain model
-        domain_model = deserialize_domain_model(serialized_domain_model)
-        return base_get_model_info(logger, domain_model)
+        serialized_domain_model = await asyncio.to_thread(download_model_from, domain_model_url)
+        return await asyncio.to_thread(_get_serialized_model_info, logger, serialized_domain_model)
 
 def register_info_tools(mcp, logger):
-    @mcp.tool()
-    def about() -> str:
-        """Get information about BESSER and this MCP server."""
-        return base_about()
-
     @mcp.tool()
     def get_model_info() -> str:
         """Get detailed information about a domain model.
@@ -16,24 +16,24 @@ logger = logging.getLogger(__name__)
 
 mcp = None
 
-if __name__ == "__main__":
-    from info import register_url_info_tools, register_base64_info_tools, register_info_tools
+
+def register_tools(mcp, logger, distant: bool = False):
+    """Register every tool family of the server on `mcp`.
+
+    Args:
+        mcp (FastMCP): The server to register the tools on.
+        logger (logging.Logger): Logger passed to the tools.
+        distant (bool): Register the URL and base64 tools instead of the local ones.
+    """
+    # Imported here: the tool modules import this module for its logger
+    from info import register_about_tool, register_url_info_tools, register_base64_info_tools, register_info_tools
     from creation import register_url_creation_tools, register_base64_creation_tools, register_creation_tools
     from delete import register_url_deletion_tools, register_base64_deletion_tools, register_deletion_tools
     from generators import register_url_generator_tools, register_base64_generator_tools, register_generator_tools
 
-    parser = argparse.ArgumentParser(
-        prog='BESSER MCP Server',
-        description='MCP Server to create B-UML models and use generators.')
-    parser.add_argument("-d",'--dist', action='store_true',
-                        help='Start the server in the distant mode')
-    parser.add_argument("-p", '--port', default=8000, type=int,
-                        help='Start the server in the distant mode')
-    args = parser.parse_args()
-
-    mcp = FastMCP("besser-mcp-server", port=args.port)
+    register_about_tool(mcp)
 
-    if args.dist:
+    if distant:
         register_url_info_tools(mcp, logger)
         register_url_creation_tools(mcp, logger)
         register_url_deletion_tools(mcp, logger)
@@ -42,11 +42,31 @@ if __name__ == "__main__":
         register_base64_creation_tools(mcp, logger)
         register_base64_deletion_tools(mcp, logger)
         register_base64_generator_tools(mcp, logger)
-        mcp.run(transport="sse")
     else:
         register_info_tools(mcp, logger)
         register_creation_tools(mcp, logger)
         register_deletion_tools(mcp, logger)
         register_generator_tools(mcp, logger)
-        mcp.run(transport="sse")
 
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog='BESSER MCP Server',
+        description='MCP Server to create B-UML models and use generators.')
+    parser.add_argument("-d",'--dist', action='store_true',
+                        help='Start the server in the distant mode')
+    parser.add_argument("-p", '--port', default=8000, type=int,
+                        help='Start the server in the distant mode')
+    parser.add_argument('--allow-legacy-payloads', action='store_true',
+                        help='Accept the untagged base64 models of earlier releases (trusted clients only)')
+    args = parser.parse_args()
+
+    if args.allow_legacy_payloads:
+        from utils import allow_legacy_payloads
+        allow_legacy_payloads()
+
+    mcp = FastMCP("besser-mcp-server", port=args.port)
+
+    register_tools(mcp, logger, distant=args.dist)
+
+    mcp.run(transport="sse")
@@ -1,7 +1,12 @@
-import base64
+import binascii
 import pickle
+import struct
+import threading
+import zlib
+from collections import OrderedDict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from besser.BUML.metamodel.structural import Multiplicity, DomainModel
 
@@ -9,35 +14,188 @@ from server import logger
 
 domain_model = None
 
+# Models produced by serialize_domain_model or decoded for a read-only caller, keyed
+# by their payload. The next deserialization of that exact payload takes the model
+# back instead of unpickling it, read-only callers only look at it and leave it for
+# the next call. Bounded by
+# the total size of the payloads, as a measure of the models kept alive. Payload
+# lengths are counted so that a payload never handed off is turned away without
+# hashing it. Shared by the tool threads, hence the lock.
+_HANDOFF_MAX_BYTES = 16 * 1024 * 1024
+_handoff: OrderedDict = OrderedDict()
+_handoff_bytes = 0
+_handoff_lengths: dict[int, int] = {}
+_handoff_lock = threading.Lock()
+
+# zlib level used for payloads: shrinks typical models several times over for a
+# fraction of the pickling cost, which also shrinks the base64 work that follows
+_COMPRESSION_LEVEL = 6
+
+# Tag in front of every payload: format name and version. Anything else is
+# rejected before it reaches zlib and pickle, unless legacy payloads are allowed.
+_PAYLOAD_MAGIC = b"BMP1"
+
+# Payloads written before the format magic are a bare pickle stream, only
+# accepted once the server opted in with allow_legacy_payloads()
+_legacy_payloads_allowed = False
+
+
+def allow_legacy_payloads(allowed: bool = True):
+    """Accept, or stop accepting, the untagged payloads written by earlier releases.
+
+    These payloads go straight to pickle, so only enable this for trusted clients.
+    """
+    global _legacy_payloads_allowed
+    _legacy_payloads_allowed = allowed
+
 def serialize_domain_model(domain_model) -> str:
-    """Convert a domain model to a base64 string using pickle."""
+    """Convert a domain model to a base64 string using pickle.
+
+    The model is pickled with protocol 5 so that large binary attributes are
+    handed over as out-of-band buffers instead of being copied into the pickle
+    stream. The pickle stream and the buffers are packed together behind a
+    small header holding the number of segments and their lengths, and the
+    whole payload is compressed, tagged with the payload format version and
+    base64 encoded.
+    """
     try:
-        # Serialize the domain model using pickle
-        pickled_data = pickle.dumps(domain_model)
+        # Serialize the domain model using pickle, collecting out-of-band buffers
+        buffers = []
+        pickled_data = pickle.dumps(domain_model, protocol=5, buffer_callback=buffers.append)
+
+        # Pack the pickle stream and the buffers behind a length-prefix header
+        packed_data = _pack_segments([pickled_data] + [buffer.raw() for buffer in buffers])
+
+        # Compress the repetitive names and metadata of the model
+        compressed_data = _PAYLOAD_MAGIC + zlib.compress(packed_data, _COMPRESSION_LEVEL)
 
         # Convert to base64 for string representation
-        encoded_data = base64.b64encode(pickled_data).decode('ascii')
+        encoded_data = binascii.b2a_base64(compressed_data, newline=False).decode('ascii')
+
+        # Keep the model at hand for the next tool call on this payload
+        _hand_off(encoded_data, domain_model)
 
         return encoded_data
 
-    except Exception as e:
+    except (pickle.PicklingError, BufferError, TypeError, AttributeError, RuntimeError) as e:
         logger.error(f"Error serializing model: {str(e)}")
         return f"Error serializing model: {str(e)}"
 
 
-def deserialize_domain_model(model_base64: str):
-    """Convert a base64 string back to a domain model object using pickle."""
+def _hand_off(model_base64: str, domain_model):
+    """Keep `domain_model` for the next deserialization of `model_base64`, evicting the oldest models."""
+    global _handoff_bytes
+    size = len(model_base64)
+    if size > _HANDOFF_MAX_BYTES:
+        return
+    with _handoff_lock:
+        if _handoff.pop(model_base64, None) is not None:
+            _forget_handoff_size(size)
+        _handoff[model_base64] = domain_model
+        _handoff_bytes += size
+        _handoff_lengths[size] = _handoff_lengths.get(size, 0) + 1
+        while _handoff_bytes > _HANDOFF_MAX_BYTES:
+            oldest, _ = _handoff.popitem(last=False)
+            _forget_handoff_size(len(oldest))
+
+
+def _forget_handoff_size(size: int):
+    """Account for a handoff entry of `size` bytes leaving the cache, with the lock held."""
+    global _handoff_bytes
+    _handoff_bytes -= size
+    _handoff_lengths[size] -= 1
+    if not _handoff_lengths[size]:
+        del _handoff_lengths[size]
+
+
+def _handed_off(model_base64: str, take: bool):
+    """Return the model kept for `model_base64`, or None. With `take`, it is removed from the cache."""
+    size = len(model_base64)
+    with _handoff_lock:
+        if size not in _handoff_lengths:
+            return None
+        if not take:
+            domain_model = _handoff.get(model_base64)
+            if domain_model is not None:
+                _handoff.move_to_end(model_base64)
+            return domain_model
+        domain_model = _handoff.pop(model_base64, None)
+        if domain_model is not None:
+            _forget_handoff_size(size)
+        return domain_model
+
+
+def deserialize_domain_model(model_base64: str, shared: bool = False):
+    """Convert a base64 string back to a domain model object using pickle.
+
+    Args:
+        model_base64 (str): The B-UML domain model as base64 string.
+        shared (bool): The caller only reads the model. It may then get the model kept for this
+            payload, and a model decoded for it is kept too, for the next call on the same payload.
+            Otherwise the returned model belongs to the caller (False as default).
+    """
+    domain_model = _handed_off(model_base64, take=not shared)
+    if domain_model is not None:
+        return domain_model
+
+    domain_model = decode_domain_model(model_base64)
+    if shared:
+        # Later readers of this payload, or the next caller that modifies it, skip the decoding
+        _hand_off(model_base64, domain_model)
+    return domain_model
+
+
+def decode_domain_model(model_base64: str):
+    """Convert a base64 string into a new domain model, leaving any model kept for it in place."""
     try:
-        # Decode from base64
-        pickled_data = base64.b64decode(model_base64.encode('ascii') + b'==')  # adding "==" avoid padding problems
+        # Decode from base64, restoring missing padding only so a well-formed payload is not copied
+        compressed_data = binascii.a2b_base64(model_base64 + '=' * (-len(model_base64) % 4))
+
+        # Reject payloads of another format or version before decompressing anything
+        if not compressed_data.startswith(_PAYLOAD_MAGIC):
+            if not _legacy_payloads_allowed:
+                raise ValueError("Not a BESSER model payload or unsupported payload version")
+            # Payload of an earlier release: a plain pickle stream
+            return pickle.loads(compressed_data)
+
+        # Decompress the packed payload
+        packed_data = zlib.decompress(memoryview(compressed_data)[len(_PAYLOAD_MAGIC):])
+
+        # Split the pickle stream from its out-of-band buffers
+        pickled_data, *buffers = _unpack_segments(packed_data)
 
         # Deserialize using pickle
-        domain_model = pickle.loads(pickled_data)
+        domain_model = pickle.loads(pickled_data, buffers=buffers)
 
         return domain_model
 
-    except Exception as e:
-        raise RuntimeError(f"Error deserializing model: {str(e)}")
+    except (ValueError, TypeError, KeyError, IndexError, OverflowError, struct.error, zlib.error,
+            pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        # Malformed base64, corrupted stream or header, or a model class that no longer resolves
+        raise RuntimeError(f"Error deserializing model: {str(e)}") from e
+
+
+def _pack_segments(segments) -> bytes:
+    """Concatenate byte segments behind a header made of their count and lengths."""
+    header = struct.pack(f"<I{len(segments)}Q", len(segments), *(len(segment) for segment in segments))
+    # A single join sizes the output once and copies every segment exactly once
+    return b"".join([header, *segments])
+
+
+def _unpack_segments(data: bytes) -> list[memoryview]:
+    """Split data produced by `_pack_segments` back into its segments without copying."""
+    view = memoryview(data)
+    (count,) = struct.unpack_from("<I", view)
+    lengths = struct.unpack_from(f"<{count}Q", view, 4)
+    offset = 4 + 8 * count
+    # The header gives the exact payload size, so a truncated payload is rejected before unpickling
+    if offset + sum(lengths) > len(view):
+        raise ValueError(f"Truncated model payload: expected {offset + sum(lengths)} bytes, got {len(view)}")
+    segments = []
+    for length in lengths:
+        segments.append(view[offset:offset + length])
+        offset += length
+    return segments
 
 def multiplicity_from_string(multiplicity_str):
     bounds = multiplicity_str.split("..")
@@ -49,19 +207,38 @@ def multiplicity_from_string(multiplicity_str):
         max = int(bounds[1])
     return Multiplicity(min, max)
 
+# Shared HTTP session for the *_with_url tools: model store connections are kept
+# alive between calls instead of being opened (and TLS-negotiated) every time.
+# The pool is sized for the worker threads running those tools concurrently.
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_maxsize=32))
+_session.mount('https://', HTTPAdapter(pool_maxsize=32))
+
+# Seconds to wait for the model store before giving up, so an unresponsive
+# store fails the tool call instead of holding a worker thread forever
+_HTTP_TIMEOUT = 30
+
 def upload_model_to(domain_model_base64: str, url: str):
     data = {'data': domain_model_base64}
-    requests.post(url, json=data)
+    response = _session.post(url, json=data, timeout=_HTTP_TIMEOUT)
+    response.raise_for_status()
 
 def download_model_from(url: str):
-    body = requests.get(url)
+    body = _session.get(url, timeout=_HTTP_TIMEOUT)
+    body.raise_for_status()
     data = body.json()
     return data['data']
 
 def get_model():
+    """Return the in-process domain model used by the local tools.
+
+    The model lives in memory for the whole server lifetime, so getting it
+    costs no read and tools mutate it in place.
+    """
     global domain_model
     return domain_model
 
 def save_model(model: DomainModel):
+    """Make `model` the in-process domain model (a reference swap, nothing is written out)."""
     global domain_model
     domain_model = model
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""Shared setup for the tests of the server modules."""
+
+import os
+import sys
+
+import pytest
+
+# The server modules import each other as top-level siblings
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'besser_mcp_server'))
+
+
+@pytest.fixture
+def domain_model():
+    """A small domain model: one class "Person" with the attributes "age" and "name"."""
+    from besser.BUML.metamodel.structural import DomainModel, Class, Property, IntegerType, StringType
+
+    person = Class(name="Person", attributes={
+        Property(name="age", type=IntegerType),
+        Property(name="name", type=StringType),
+    })
+    return DomainModel(name="TestModel", types={person})
+
+
+class _ToolRecorder:
+    """Stands in for FastMCP and records the functions registered as tools."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def decorator(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+        return decorator
+
+
+@pytest.fixture
+def mcp():
+    """A stand-in MCP server, its `tools` maps each registered tool name to its function."""
+    return _ToolRecorder()
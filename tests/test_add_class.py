@@ -2,16 +2,21 @@
 """Tests for add_class and new_model tools in MCP server."""
 """Tests for add_class, new_model, and sql_generation tools in MCP server."""
 
-import asyncio
 import pytest
 
+# Skip the whole module once, at collection, when BESSER is not installed
+pytest.importorskip("besser")
+
 from besser_mcp_server.server import add_class
 from besser_mcp_server.server import add_class, new_model, sql_generation
 
 from besser.BUML.metamodel.structural import DomainModel, Class
 
+# Every test of this module shares one event loop instead of starting its own
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-async def _run_add():
+async def test_add_class_tool():
     # Create initial model with one class
     class_a = Class(name="ClassA")
     model = DomainModel(name="TestModel", types={class_a})
@@ -19,44 +24,27 @@ async def _run_add():
     # Call tool to add new class
     updated_model = await add_class(model, name="ClassB")
 
-    return updated_model
-
-
-def test_add_class_tool():
-    updated_model = asyncio.run(_run_add())
-
     class_names = {cls.name for cls in updated_model.get_classes()}
 
     assert class_names == {"ClassA", "ClassB"}
 
 
-async def _run_add_duplicate():
+async def test_add_duplicate_class_returns_error():
     # Create initial model with one class
     class_a = Class(name="ClassA")
     model = DomainModel(name="TestModel", types={class_a})
 
     # Try to add class with same name - should return error
     result = await add_class(model, name="ClassA")
-
-    return result
-
-
-def test_add_duplicate_class_returns_error():
-    result = asyncio.run(_run_add_duplicate())
     
     # Should return error string instead of model
     assert isinstance(result, str)
     assert "Error adding class 'ClassA':" in result
 
 
-async def _run_new_model():
+async def test_new_model_tool():
     # Create a new model with specified name
     model = await new_model(name="TestNewModel")
-    return model
-
-
-def test_new_model_tool():
-    model = asyncio.run(_run_new_model())
     
     # Should return a DomainModel instance
     assert isinstance(model, DomainModel)
@@ -65,29 +53,22 @@ def test_new_model_tool():
     assert len(model.types) >= 0  # May have default primitive types
 
 
-async def _run_integration_test():
+async def test_new_model_and_add_class_integration():
     # Create a new model
     model = await new_model(name="IntegrationTestModel")
     
     # Add a class to the new model
-    updated_model = await add_class(model, name="TestClass")
-    
-    return updated_model
-
-
-def test_new_model_and_add_class_integration():
-    model = asyncio.run(_run_integration_test())
+    model = await add_class(model, name="TestClass")
     
     # Should return a DomainModel instance
     assert isinstance(model, DomainModel)
     assert model.name == "IntegrationTestModel"
     
     # Should contain the added class
-    class_names = {cls.name for cls in model.get_classes()}
-    assert "TestClass" in class_names
+    assert any(cls.name == "TestClass" for cls in model.get_classes())
 
 
-async def _run_sql_generation():
+async def test_sql_generation_tool():
     # Create a model with a class
     model = await new_model(name="SQLTestModel")
     model_with_class = await add_class(model, name="TestEntity")
@@ -95,49 +76,32 @@ async def _run_sql_generation():
     # Generate SQL from the model
     sql_result = await sql_generation(model_with_class)
     
-    return sql_result
-
-
-def test_sql_generation_tool():
-    sql_result = asyncio.run(_run_sql_generation())
-    
     # Should return a string (either SQL or error message)
     assert isinstance(sql_result, str)
     # Should not be empty
     assert len(sql_result) > 0
     # For a successful generation, it should contain SQL keywords or be an informative message
-    assert ("CREATE" in sql_result.upper() or 
-            "TABLE" in sql_result.upper() or 
+    upper_result = sql_result.upper()
+    assert ("CREATE" in upper_result or 
+            "TABLE" in upper_result or 
             "No SQL generated" in sql_result or
             "Error generating SQL" in sql_result)
 
 
-async def _run_sql_generation_empty_model():
+async def test_sql_generation_empty_model():
     # Create an empty model (no classes)
     model = await new_model(name="EmptyModel")
     
     # Generate SQL from empty model
     sql_result = await sql_generation(model)
     
-    return sql_result
-
-
-def test_sql_generation_empty_model():
-    sql_result = asyncio.run(_run_sql_generation_empty_model())
-    
     # Should return a string indicating no SQL was generated
     assert isinstance(sql_result, str)
     assert len(sql_result) > 0
 
 
-@pytest.mark.asyncio
 async def test_sql_generation_adds_id_to_empty_classes():
     """Test that sql_generation adds id attribute to classes without attributes."""
-    pytest.importorskip("besser")
-    
-    from besser.BUML.metamodel.structural import DomainModel
-    from besser_mcp_server.server import new_model, add_class, sql_generation
-    
     # Create a new model
     model = await new_model("TestModel")
     
@@ -159,8 +123,9 @@ async def test_sql_generation_adds_id_to_empty_classes():
     assert not sql_result.startswith("No SQL generated")
     
     # Verify the class now has an id attribute
-    assert len(empty_class.attributes) == 1
-    id_attr = next(iter(empty_class.attributes))
+    attributes = list(empty_class.attributes)
+    assert len(attributes) == 1
+    id_attr = attributes[0]
     assert id_attr.name == "id"
     assert id_attr.type.name == "int"
     assert id_attr.is_id is True 
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""Tests for the batch creation and deletion of model elements."""
+
+import logging
+
+import pytest
+
+# Skip the whole module once, at collection, when BESSER or the MCP SDK is not installed
+pytest.importorskip("besser")
+pytest.importorskip("mcp")
+
+from besser.BUML.metamodel.structural import DomainModel
+
+import creation
+import delete
+from utils import get_model, save_model
+
+logger = logging.getLogger(__name__)
+
+
+def _attribute_names(model):
+    return {attr.name for attr in model.get_type_by_name("Person").attributes}
+
+
+def test_delete_batch_applies_every_deletion(domain_model):
+    result = delete.base_delete_batch(logger, domain_model, [
+        {"kind": "attribute", "name": "age", "class_name": "Person"},
+        {"kind": "attribute", "name": "name", "class_name": "Person"},
+    ])
+
+    assert isinstance(result, DomainModel)
+    assert _attribute_names(result) == set()
+
+
+def test_delete_batch_reports_the_failing_deletion(domain_model):
+    result = delete.base_delete_batch(logger, domain_model, [
+        {"kind": "attribute", "name": "age", "class_name": "Person"},
+        {"kind": "attribute", "name": "missing", "class_name": "Person"},
+    ])
+
+    assert isinstance(result, str)
+    assert result.startswith("Error in deletion #1 (attribute):")
+
+
+@pytest.mark.parametrize("operation", [
+    "not a mapping",
+    {"kind": "unknown"},
+    {"kind": "attribute", "unexpected": "argument"},
+])
+def test_delete_batch_invalid_operation_returns_error(domain_model, operation):
+    result = delete.base_delete_batch(logger, domain_model, [
+        {"kind": "attribute", "name": "age", "class_name": "Person"},
+        operation,
+    ])
+
+    assert isinstance(result, str)
+    assert result.startswith("Error in deletion #1")
+
+
+def test_local_delete_batch_keeps_shared_model_on_failure(domain_model):
+    save_model(domain_model)
+
+    result = delete._delete_local(logger, delete.base_delete_batch, [
+        {"kind": "attribute", "name": "age", "class_name": "Person"},
+        {"kind": "attribute", "name": "missing", "class_name": "Person"},
+    ], rollback=True)
+
+    # The first deletion must not have been applied to the shared model
+    assert result.startswith("Error in deletion #1")
+    assert get_model() is domain_model
+    assert _attribute_names(get_model()) == {"age", "name"}
+
+
+def test_local_delete_batch_saves_updated_model(domain_model):
+    save_model(domain_model)
+
+    result = delete._delete_local(logger, delete.base_delete_batch, [
+        {"kind": "attribute", "name": "age", "class_name": "Person"},
+    ], rollback=True)
+
+    assert result == "Success"
+    assert _attribute_names(get_model()) == {"name"}
+
+
+def _type_names(model):
+    return {t.name for t in model.types}
+
+
+def test_add_batch_applies_every_addition(domain_model):
+    result = creation.base_add_batch(logger, domain_model, [
+        {"kind": "class", "name": "Address"},
+        {"kind": "class", "name": "Company"},
+    ])
+
+    assert isinstance(result, DomainModel)
+    assert _type_names(result) == {"Person", "Address", "Company"}
+
+
+def test_add_batch_reports_the_failing_addition(domain_model):
+    result = creation.base_add_batch(logger, domain_model, [
+        {"kind": "class", "name": "Address"},
+        {"kind": "class", "name": "Person"},
+    ])
+
+    assert isinstance(result, str)
+    assert result.startswith("Error in addition #1 (class):")
+
+
+def test_local_add_batch_keeps_shared_model_on_failure(domain_model, mcp):
+    creation.register_creation_tools(mcp, logger)
+    save_model(domain_model)
+
+    result = mcp.tools["add_batch"]([
+        {"kind": "class", "name": "Address"},
+        {"kind": "class", "name": "Person"},
+    ])
+
+    # The first addition must not have been applied to the shared model
+    assert result.startswith("Error in addition #1 (class):")
+    assert get_model() is domain_model
+    assert _type_names(get_model()) == {"Person"}
+
+
+def test_local_add_batch_saves_updated_model(domain_model, mcp):
+    creation.register_creation_tools(mcp, logger)
+    save_model(domain_model)
+
+    result = mcp.tools["add_batch"]([
+        {"kind": "class", "name": "Address"},
+    ])
+
+    assert result == "Success"
+    assert _type_names(get_model()) == {"Person", "Address"}
+
+
+@pytest.mark.parametrize("operation", [
+    "not a mapping",
+    {"kind": "unknown"},
+    {"kind": "class", "unexpected": "argument"},
+])
+def test_add_batch_invalid_operation_returns_error(domain_model, operation):
+    result = creation.base_add_batch(logger, domain_model, [
+        {"kind": "class", "name": "Address"},
+        operation,
+    ])
+
+    assert isinstance(result, str)
+    assert result.startswith("Error in addition #1")
@@ -0,0 +1,117 @@
+"""Tests for the generators run on serialized domain models."""
+
+import asyncio
+import logging
+import os
+
+import pytest
+
+# Skip the whole module once, at collection, when BESSER or the MCP SDK is not installed
+pytest.importorskip("besser")
+pytest.importorskip("mcp")
+
+import generators
+import utils
+
+logger = logging.getLogger(__name__)
+
+
+def _fake_python_generation(domain_model, path="."):
+    with open(os.path.join(path, "classes.py"), "w", encoding="utf-8") as f:
+        f.write("class Person: ...")
+
+
+def test_multi_generation_reports_each_kind(domain_model, monkeypatch):
+    monkeypatch.setattr(generators, "base_python_generation", _fake_python_generation)
+    payload = utils.serialize_domain_model(domain_model)
+
+    result = generators._generate_many(payload, ["python", "python", "unknown"])
+
+    # Duplicated kinds are generated once, an unknown kind does not fail the other ones
+    assert list(result) == ["python", "unknown"]
+    assert result["python"] == "class Person: ..."
+    assert result["unknown"].startswith("Error: Unknown generator 'unknown'")
+
+
+def test_multi_generation_base64_tool(domain_model, monkeypatch, mcp):
+    monkeypatch.setattr(generators, "base_python_generation", _fake_python_generation)
+    generators.register_base64_generator_tools(mcp, logger)
+    payload = utils.serialize_domain_model(domain_model)
+
+    result = asyncio.run(mcp.tools["multi_generation_base64"](payload, ["python"]))
+
+    assert result == {"python": "class Person: ..."}
+
+
+def test_generation_output_is_reused(domain_model, monkeypatch):
+    calls = []
+
+    def counting_json_generation(domain_model, path="."):
+        calls.append(path)
+        with open(os.path.join(path, "schema.json"), "w", encoding="utf-8") as f:
+            f.write("{}")
+
+    monkeypatch.setattr(generators, "base_json_generation", counting_json_generation)
+    payload = utils.serialize_domain_model(domain_model)
+
+    first = generators._generate_from_payload(payload, "json_schema")
+    second = generators._generate_from_payload(payload, "json_schema")
+
+    assert first == second == "{}"
+    assert len(calls) == 1
+
+
+def test_generation_failures_are_not_remembered(domain_model, monkeypatch):
+    calls = []
+
+    def failing_rdf_generation(domain_model, path="."):
+        calls.append(path)
+        return "Error generating RDF from domain model: boom"
+
+    monkeypatch.setattr(generators, "base_rdf_generation", failing_rdf_generation)
+    payload = utils.serialize_domain_model(domain_model)
+
+    first = generators._generate_many(payload, ["rdf"])
+    second = generators._generate_many(payload, ["rdf"])
+
+    assert first == second == {"rdf": "Error generating RDF from domain model: boom"}
+    assert len(calls) == 2
+
+
+def test_each_generator_gets_its_own_model(domain_model, monkeypatch):
+    models = []
+
+    def recording_generation(filename):
+        def generate(domain_model, path=".", **kwargs):
+            models.append(domain_model)
+            with open(os.path.join(path, filename), "w", encoding="utf-8") as f:
+                f.write(domain_model.name)
+        return generate
+
+    monkeypatch.setattr(generators, "base_sql_generation", recording_generation("tables_postgresql"))
+    monkeypatch.setattr(generators, "base_rdf_generation", recording_generation("vocabulary.ttl"))
+    domain_model.name = "PrivateModels"
+    payload = utils.serialize_domain_model(domain_model)
+
+    generators._generate_many(payload, ["sql", "rdf"], "postgresql")
+
+    assert len(models) == 2
+    assert models[0] is not models[1]
+    assert all(model is not domain_model for model in models)
+    # The model kept for the payload is left for the next call
+    assert utils.deserialize_domain_model(payload) is domain_model
+
+
+@pytest.mark.parametrize("kind, message", [
+    ("sql", "No SQL generated. The domain model contains 1 class(es): Person (2 attributes). The SQL generator "
+            "may require additional configuration or the classes may not meet SQL generation requirements."),
+    ("rdf", "No RDF Vocabulary generated. The domain model contains 1 class(es): Person (2 attributes). The RDF "
+            "Vocabulary generator may require additional configuration or the classes may not meet generation "
+            "requirements."),
+])
+def test_empty_output_is_explained(domain_model, monkeypatch, kind, message):
+    # A generator that runs without writing its file
+    monkeypatch.setattr(generators, f"base_{kind}_generation", lambda domain_model, path=".", **kwargs: None)
+    domain_model.name = f"Explained{kind}"
+
+    assert generators._generate_from_payload(utils.serialize_domain_model(domain_model), kind) == message
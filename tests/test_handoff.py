@@ -0,0 +1,73 @@
+"""Tests for the models handed from serialize_domain_model to the next deserialization."""
+
+from collections import OrderedDict
+
+import pytest
+
+# Skip the whole module once, at collection, when BESSER or the MCP SDK is not installed
+pytest.importorskip("besser")
+pytest.importorskip("mcp")
+
+import utils
+
+
+def test_handoff_returns_the_serialized_model_once(domain_model):
+    payload = utils.serialize_domain_model(domain_model)
+
+    # The first deserialization takes the model back, the next one decodes a new model
+    assert utils.deserialize_domain_model(payload) is domain_model
+    decoded = utils.deserialize_domain_model(payload)
+    assert decoded is not domain_model
+    assert decoded.name == domain_model.name
+
+
+def test_shared_deserialization_leaves_the_model_in_place(domain_model):
+    payload = utils.serialize_domain_model(domain_model)
+
+    assert utils.deserialize_domain_model(payload, shared=True) is domain_model
+    assert utils.deserialize_domain_model(payload, shared=True) is domain_model
+    # A caller that modifies the model still gets it, then it is gone
+    assert utils.deserialize_domain_model(payload) is domain_model
+    assert utils.deserialize_domain_model(payload, shared=True) is not domain_model
+
+
+def test_decode_leaves_the_model_in_place(domain_model):
+    payload = utils.serialize_domain_model(domain_model)
+
+    assert utils.decode_domain_model(payload) is not domain_model
+    assert utils.deserialize_domain_model(payload) is domain_model
+
+
+def test_handoff_is_bounded_by_payload_size(domain_model, monkeypatch):
+    payloads = []
+    for name in ("First", "Second", "Third"):
+        domain_model.name = name
+        payloads.append(utils.serialize_domain_model(domain_model))
+
+    # Start from an empty cache with room for the two most recent payloads only
+    monkeypatch.setattr(utils, "_handoff", OrderedDict())
+    monkeypatch.setattr(utils, "_handoff_bytes", 0)
+    monkeypatch.setattr(utils, "_handoff_lengths", {})
+    monkeypatch.setattr(utils, "_HANDOFF_MAX_BYTES", len(payloads[1]) + len(payloads[2]))
+    models = [object(), object(), object()]
+    for payload, model in zip(payloads, models):
+        utils._hand_off(payload, model)
+
+    assert utils._handed_off(payloads[0], take=False) is None
+    assert utils._handed_off(payloads[1], take=True) is models[1]
+    assert utils._handed_off(payloads[2], take=True) is models[2]
+    assert utils._handoff_bytes == 0
+    assert utils._handoff_lengths == {}
+
+
+def test_shared_deserialization_keeps_the_decoded_model(domain_model):
+    payload = utils.serialize_domain_model(domain_model)
+    utils._handed_off(payload, take=True)
+
+    # The first reader decodes the payload, the next ones reuse that model
+    first = utils.deserialize_domain_model(payload, shared=True)
+    assert first is not domain_model
+    assert utils.deserialize_domain_model(payload, shared=True) is first
+    # The next caller that modifies the model takes it over
+    assert utils.deserialize_domain_model(payload) is first
+    assert utils.deserialize_domain_model(payload) is not first
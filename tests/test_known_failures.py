@@ -0,0 +1,61 @@
+"""Tests for the cache of deletions known to fail on a serialized model."""
+
+import logging
+from collections import OrderedDict
+
+import pytest
+
+# Skip the whole module once, at collection, when BESSER or the MCP SDK is not installed
+pytest.importorskip("besser")
+pytest.importorskip("mcp")
+
+import delete
+import utils
+
+logger = logging.getLogger(__name__)
+
+
+def _failing_delete(calls):
+    def base_delete_missing(logger, domain_model, name):
+        calls.append(name)
+        return f"Error removing '{name}'"
+    return base_delete_missing
+
+
+def test_known_failure_skips_the_deletion(domain_model):
+    payload = utils.serialize_domain_model(domain_model)
+    calls = []
+    failing_delete = _failing_delete(calls)
+
+    first = delete._delete_from_base64(logger, failing_delete, payload, "missing")
+    second = delete._delete_from_base64(logger, failing_delete, payload, "missing")
+
+    assert first == second == "Error removing 'missing'"
+    assert calls == ["missing"]
+
+
+def test_other_arguments_are_not_known_failures(domain_model):
+    payload = utils.serialize_domain_model(domain_model)
+    calls = []
+    failing_delete = _failing_delete(calls)
+
+    delete._delete_from_base64(logger, failing_delete, payload, "first")
+    delete._delete_from_base64(logger, failing_delete, payload, "second")
+
+    assert calls == ["first", "second"]
+
+
+def test_known_failures_are_bounded(domain_model, monkeypatch):
+    # Start from an empty cache with room for two failures
+    monkeypatch.setattr(delete, "_known_failures", OrderedDict())
+    monkeypatch.setattr(delete, "_failure_shapes", {})
+    monkeypatch.setattr(delete, "_KNOWN_FAILURES_SIZE", 2)
+    payload = utils.serialize_domain_model(domain_model)
+    failing_delete = _failing_delete([])
+
+    for name in ("a", "b", "c"):
+        delete._delete_from_base64(logger, failing_delete, payload, name)
+
+    assert len(delete._known_failures) == len(delete._failure_shapes) == 2
+    assert delete._known_failure(payload, failing_delete, ("a",)) is None
+    assert delete._known_failure(payload, failing_delete, ("c",)) == "Error removing 'c'"
@@ -0,0 +1,105 @@
+"""Tests for the serialized model payloads."""
+
+import base64
+import binascii
+import pickle
+import zlib
+
+import pytest
+
+# Skip the whole module once, at collection, when BESSER or the MCP SDK is not installed
+pytest.importorskip("besser")
+pytest.importorskip("mcp")
+
+import utils
+
+
+def _encode(raw: bytes) -> str:
+    return binascii.b2a_base64(raw, newline=False).decode('ascii')
+
+
+def _fresh_payload(model) -> str:
+    # Serialize and drop the handoff entry, so the payload is really decoded
+    payload = utils.serialize_domain_model(model)
+    utils._handed_off(payload, take=True)
+    return payload
+
+
+def test_round_trip_keeps_the_model(domain_model):
+    payload = _fresh_payload(domain_model)
+
+    model = utils.deserialize_domain_model(payload)
+
+    assert model is not domain_model
+    assert model.name == "TestModel"
+    assert {attr.name for attr in model.get_type_by_name("Person").attributes} == {"age", "name"}
+
+
+def test_unpicklable_model_returns_error_message(domain_model):
+    domain_model.callback = lambda: None
+
+    assert utils.serialize_domain_model(domain_model).startswith("Error serializing model")
+
+
+def test_segments_round_trip():
+    segments = [b"pickle", b"", b"buffer"]
+
+    assert [bytes(s) for s in utils._unpack_segments(utils._pack_segments(segments))] == segments
+
+
+@pytest.mark.parametrize("raw", [
+    utils._PAYLOAD_MAGIC + b"not zlib data",
+    utils._PAYLOAD_MAGIC + zlib.compress(b"\x01"),
+    utils._PAYLOAD_MAGIC + zlib.compress(b"\x02\x00\x00\x00" + b"\xff" * 16),
+])
+def test_corrupt_payload_raises_runtime_error(raw):
+    with pytest.raises(RuntimeError, match="Error deserializing model"):
+        utils.deserialize_domain_model(_encode(raw))
+
+
+def test_truncated_payload_raises_runtime_error(domain_model):
+    raw = binascii.a2b_base64(_fresh_payload(domain_model))
+    packed = zlib.decompress(raw[len(utils._PAYLOAD_MAGIC):])
+    truncated = utils._PAYLOAD_MAGIC + zlib.compress(packed[:-1])
+
+    with pytest.raises(RuntimeError, match="Truncated model payload"):
+        utils.deserialize_domain_model(_encode(truncated))
+
+
+def test_payload_starts_with_format_magic(domain_model):
+    payload = _fresh_payload(domain_model)
+
+    assert binascii.a2b_base64(payload).startswith(utils._PAYLOAD_MAGIC)
+
+
+@pytest.mark.parametrize("raw", [
+    b"not a pickle stream",
+    pickle.dumps("an untagged pickle stream"),
+])
+def test_untagged_payload_is_rejected(raw):
+    with pytest.raises(RuntimeError, match="Not a BESSER model payload"):
+        utils.deserialize_domain_model(_encode(raw))
+
+
+def test_legacy_payload_is_rejected_by_default(domain_model):
+    # Payloads written before the format magic are a plain base64 pickle stream
+    payload = base64.b64encode(pickle.dumps(domain_model)).decode('ascii')
+
+    with pytest.raises(RuntimeError, match="Not a BESSER model payload"):
+        utils.deserialize_domain_model(payload)
+
+
+def test_legacy_payload_is_accepted_once_allowed(domain_model, monkeypatch):
+    monkeypatch.setattr(utils, "_legacy_payloads_allowed", False)
+    utils.allow_legacy_payloads()
+    payload = base64.b64encode(pickle.dumps(domain_model)).decode('ascii')
+
+    assert utils.deserialize_domain_model(payload).name == "TestModel"
+
+
+
+def test_payload_without_padding_is_accepted(domain_model):
+    payload = _fresh_payload(domain_model)
+
+    assert utils.deserialize_domain_model(payload).name == "TestModel"
+    assert utils.deserialize_domain_model(payload.rstrip("=")).name == "TestModel"